@@ -0,0 +1,61 @@
+"""Hatch build hook — bake the metrics catalog into the wheel as Python.
+
+``conf/metrics_catalog.yml`` lives outside the package and only changes at
+release time, so wheel builds render it into ``piper/_catalog_data.py``.
+``piper.catalog.get_catalog()`` imports that module when present and only
+falls back to parsing the YAML file in a source checkout.
+
+The rendering itself lives in ``piper.catalog.render_catalog_module`` so it
+can be tested without hatchling installed; this hook only wires it into the
+build.
+
+Editable installs are skipped so that catalog edits in a dev checkout take
+effect without a rebuild.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+_CATALOG_FILE = Path("conf") / "metrics_catalog.yml"
+_TARGET = "piper/_catalog_data.py"
+
+
+class CatalogBuildHook(BuildHookInterface):
+    """Render the metrics catalog into the wheel (non-editable builds only)."""
+
+    PLUGIN_NAME = "custom"
+
+    # Scratch directory holding the rendered module until the wheel is written.
+    _out_dir: Path | None = None
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if version == "editable":
+            return
+
+        # The package being built is not installed in the build environment;
+        # piper.catalog needs only the stdlib and PyYAML at import time.
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        try:
+            from piper.catalog import render_catalog_module
+        finally:
+            sys.path.pop(0)
+
+        self._out_dir = Path(tempfile.mkdtemp(prefix="piper-build-"))
+        out_file = self._out_dir / "_catalog_data.py"
+        out_file.write_text(
+            render_catalog_module(Path(self.root) / _CATALOG_FILE),
+            encoding="utf-8",
+        )
+        build_data["force_include"][str(out_file)] = _TARGET
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+        if self._out_dir is not None:
+            shutil.rmtree(self._out_dir, ignore_errors=True)
+            self._out_dir = None
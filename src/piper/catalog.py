@@ -1,8 +1,13 @@
 """Metrics catalog — structured index of every gold metric.
 
-``get_catalog()`` loads the bundled ``conf/metrics_catalog.yml`` and returns
-a list of ``CatalogEntry`` dataclasses.  The catalog is the authoritative
-reference for what each Grafana panel measures and who owns it.
+``get_catalog()`` loads the bundled ``conf/metrics_catalog.yml`` once per
+process and returns a tuple of ``CatalogEntry`` dataclasses.  The catalog is
+the authoritative reference for what each Grafana panel measures and who
+owns it.
+
+Installed wheels carry the catalog pre-rendered as ``piper._catalog_data``
+(generated by ``hatch_build.py`` through :func:`render_catalog_module`), so
+PyYAML is only imported when running from a source checkout.
 
 Schema
 ------
@@ -17,16 +22,27 @@ Each YAML entry must have:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
-
 # Bundled catalog file — lives alongside conf/settings.toml.
 _CATALOG_FILE = Path(__file__).parent.parent.parent / "conf" / "metrics_catalog.yml"
 
+# Opening of the generated piper._catalog_data module; see render_catalog_module().
+_MODULE_HEADER = '''\
+"""Metrics catalog data — generated from conf/metrics_catalog.yml at build time.
+
+Do not edit: this module is rewritten by hatch_build.py on every wheel build.
+"""
+
+from piper.catalog import CatalogEntry
+
+CATALOG: tuple[CatalogEntry, ...] = (
+'''
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CatalogEntry:
     """One metric in the catalog."""
 
@@ -38,23 +54,52 @@ class CatalogEntry:
     refresh: str
 
 
-def load_catalog(path: Path) -> list[CatalogEntry]:
+def load_catalog(path: Path) -> tuple[CatalogEntry, ...]:
     """Load and parse a metrics catalog YAML file.
 
     Args:
         path: Path to a ``metrics_catalog.yml``-format file.
 
     Returns:
-        List of ``CatalogEntry`` objects, one per metric.
+        Tuple of ``CatalogEntry`` objects, one per metric, in file order.
 
     Raises:
         KeyError:   If the file is missing the ``metrics`` top-level key.
         TypeError:  If an entry is missing a required field.
     """
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return [CatalogEntry(**entry) for entry in raw["metrics"]]
+    import yaml
 
+    # libyaml-backed loader when PyYAML was built with it; pure-Python otherwise.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    raw = yaml.load(path.read_bytes(), Loader=loader)
+    return tuple(CatalogEntry(**entry) for entry in raw["metrics"])
 
-def get_catalog() -> list[CatalogEntry]:
-    """Return the bundled metrics catalog (loaded from ``conf/metrics_catalog.yml``)."""
-    return load_catalog(_CATALOG_FILE)
+
+@lru_cache(maxsize=1)
+def get_catalog() -> tuple[CatalogEntry, ...]:
+    """Return the bundled metrics catalog (loaded once, cached thereafter).
+
+    Uses the build-time ``piper._catalog_data`` module when present and
+    falls back to parsing ``conf/metrics_catalog.yml`` otherwise.  Tests that
+    swap the catalog file should call ``get_catalog.cache_clear()``.
+    """
+    try:
+        from piper._catalog_data import CATALOG  # type: ignore[import-not-found]
+    except ImportError:
+        return load_catalog(_CATALOG_FILE)
+    return CATALOG
+
+
+def render_catalog_module(path: Path) -> str:
+    """Return the source of ``piper._catalog_data`` for the catalog at *path*.
+
+    Each metric is emitted as a literal ``CatalogEntry(...)`` call so that
+    importing the module builds the final tuple with no intermediate dicts.
+    Called by ``hatch_build.py`` at wheel build time.
+    """
+    lines = [_MODULE_HEADER]
+    for entry in load_catalog(path):
+        kwargs = ", ".join(f"{f.name}={getattr(entry, f.name)!r}" for f in fields(entry))
+        lines.append(f"    CatalogEntry({kwargs}),\n")
+    lines.append(")\n")
+    return "".join(lines)
@@ -13,10 +13,17 @@ Command surface:
   piper config show     print resolved configuration
 """
 
+from functools import cache
+from typing import TYPE_CHECKING
+
 import typer
 
 from piper import __version__
-from piper.logging import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import structlog
 
 app = typer.Typer(
     name="piper",
@@ -24,7 +31,17 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-_log = get_logger(__name__)
+
+@cache
+def _log() -> "structlog.BoundLogger":
+    """Return the CLI logger, importing structlog and settings on first use.
+
+    Deferred so that ``--version``, ``--help``, and shell completion do not
+    pay for importing structlog and the logging setup.
+    """
+    from piper.logging import get_logger
+
+    return get_logger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +57,7 @@ def _version_callback(value: bool) -> None:
 
 @app.callback()
 def _main(
+    ctx: typer.Context,
     version: bool = typer.Option(
         False,
         "--version",
@@ -50,11 +68,18 @@ def _main(
     ),
 ) -> None:
     """Diagnostics dashboard for the sandwich USD production pipeline."""
-    # Eager options (--version) raise typer.Exit() before this body runs,
-    # so configure_logging() is only called for real subcommands.
+    # Eager options (--version) raise typer.Exit() before this body runs.
+    # Shell completion and bare group invocations never log, so skip the
+    # structlog import and processor setup for them too.
+    if ctx.resilient_parsing or ctx.invoked_subcommand is None:
+        return
+
     from piper.logging import configure_logging
 
     configure_logging()
+    # Loggers cache their configuration on first use; start each invocation
+    # with a fresh one.
+    _log.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -77,16 +102,16 @@ def init() -> None:
     settings = get_settings()
     paths = ProjectPaths.from_settings(settings)
     paths.ensure_output_dirs()
-    _log.info("output directories ready", data_root=str(paths.data_root))
+    _log().info("output directories ready", data_root=str(paths.data_root))
 
     conn = open_warehouse(paths)
     n = run_migrations(conn)
     conn.close()
 
     if n:
-        _log.info("schema migrations applied", count=n)
+        _log().info("schema migrations applied", count=n)
     else:
-        _log.info("schema is up to date")
+        _log().info("schema is up to date")
 
 
 # ---------------------------------------------------------------------------
@@ -116,9 +141,9 @@ def ingest(
     """
     from piper.config import get_settings
     from piper.discovery import FoundFile, discover_settled_files
-    from piper.ingest import IngestStats, ingest_file
+    from piper.ingest import IngestStats, load_prepared_many, prepare_files
     from piper.lock import LockError, RunLock
-    from piper.manifest import is_already_ingested, mark_ingested
+    from piper.manifest import filter_pending, mark_ingested_many
     from piper.paths import ProjectPaths
     from piper.warehouse import open_warehouse, run_migrations
 
@@ -130,18 +155,18 @@ def ingest(
     run_migrations(conn)
 
     files = discover_settled_files(paths.raw_root, settings.ingest.settle_seconds)
-    _log.info("discovery complete", total=len(files))
+    _log().info("discovery complete", total=len(files))
 
     pending: list[FoundFile] = []
     results: list[IngestStats] = []
 
     try:
         with RunLock(paths.state_dir):
-            pending = [f for f in files if not is_already_ingested(conn, f)]
+            pending = filter_pending(conn, files)
             if limit:
                 pending = pending[:limit]
 
-            _log.info(
+            _log().info(
                 "ingest plan",
                 pending=len(pending),
                 already_ingested=len(files) - len(pending),
@@ -152,25 +177,40 @@ def ingest(
                 for file in pending:
                     typer.echo(f"  {file.path}")
             else:
-                for file in pending:
-                    stats = ingest_file(conn, file, quarantine_dir=paths.quarantine_dir)
-                    mark_ingested(
-                        conn,
-                        file,
-                        event_count=stats.accepted,
-                        error_count=stats.quarantined,
+                prepared_files = prepare_files(
+                    [f.path for f in pending], workers=settings.ingest.workers
+                )
+                # The whole batch is one transaction so silver rows and their
+                # manifest entries commit together (one WAL flush per run).
+                # Quarantine files are written outside it and are not undone.
+                conn.begin()
+                try:
+                    loaded = load_prepared_many(
+                        conn, prepared_files, quarantine_dir=paths.quarantine_dir
                     )
-                    results.append(stats)
-                    _log.info(
-                        "file ingested",
-                        path=str(file.path),
-                        accepted=stats.accepted,
-                        duplicate=stats.duplicate,
-                        quarantined=stats.quarantined,
+                    for file, stats in zip(pending, loaded, strict=True):
+                        results.append(stats)
+                        _log().info(
+                            "file ingested",
+                            path=str(file.path),
+                            accepted=stats.accepted,
+                            duplicate=stats.duplicate,
+                            quarantined=stats.quarantined,
+                        )
+                    mark_ingested_many(
+                        conn,
+                        [
+                            (file, stats.accepted, stats.quarantined)
+                            for file, stats in zip(pending, results, strict=True)
+                        ],
                     )
+                except BaseException:
+                    conn.rollback()
+                    raise
+                conn.commit()
 
     except LockError as exc:
-        _log.error("piper already running", detail=str(exc))
+        _log().error("piper already running", detail=str(exc))
         raise typer.Exit(1) from exc
 
     finally:
@@ -181,9 +221,11 @@ def ingest(
     if dry_run:
         typer.echo(f"\nDry run — {n} file(s) would be ingested")
     else:
-        accepted = sum(s.accepted for s in results)
-        duplicate = sum(s.duplicate for s in results)
-        quarantined = sum(s.quarantined for s in results)
+        accepted = duplicate = quarantined = 0
+        for stats in results:
+            accepted += stats.accepted
+            duplicate += stats.duplicate
+            quarantined += stats.quarantined
         typer.echo(f"\nIngest complete — {n} file(s) processed")
         typer.echo(f"  rows accepted:      {accepted}")
         typer.echo(f"  rows duplicate:     {duplicate}")
@@ -221,7 +263,7 @@ def backfill(
     the given window, ignoring the ingest manifest.  Use this after
     recovering from a pipeline gap or correcting a data quality issue.
     """
-    _log.info("backfill started", start=start, end=end, force=force)
+    _log().info("backfill started", start=start, end=end, force=force)
 
 
 # ---------------------------------------------------------------------------
@@ -231,25 +273,30 @@ def backfill(
 
 @app.command("materialize")
 def materialize(
-    model: str = typer.Option(
-        "",
+    models: list[str] = typer.Option(
+        [],
         "--model",
         "-m",
-        help="Rebuild only this named silver or gold model.  Empty = all.",
+        help="Rebuild only this named silver or gold model (repeatable).  Omit for all.",
     ),
 ) -> None:
     """Rebuild silver and gold SQL models from silver_events.
 
     Executes silver domain SQL models first (publish, tool, farm, render,
     storage), then gold KPI models in dependency order.  All models are
-    CREATE OR REPLACE, so this is safe to run at any time.
+    CREATE OR REPLACE, so this is safe to run at any time.  Several
+    ``--model`` flags rebuild those models in one run, in the order given.
     """
-    from pathlib import Path
-
     from piper.config import get_settings
     from piper.paths import ProjectPaths
     from piper.sql_runner import run_sql_file
-    from piper.warehouse import open_warehouse, run_gold_views, run_migrations, run_silver_views
+    from piper.warehouse import (
+        model_sql_path,
+        open_warehouse,
+        run_gold_views,
+        run_migrations,
+        run_silver_views,
+    )
 
     settings = get_settings()
     paths = ProjectPaths.from_settings(settings)
@@ -258,21 +305,26 @@ def materialize(
     conn = open_warehouse(paths)
     run_migrations(conn)
 
-    if model:
+    if models:
+        # Resolve every name before applying any SQL so a typo in one
+        # --model flag does not leave the others half-applied.
+        sql_files: dict[str, Path] = {}
+        for model in models:
+            sql_file = model_sql_path(model)
+            if sql_file is None:
+                conn.close()
+                typer.echo(f"Error: model {model!r} not found in silver or gold SQL dirs", err=True)
+                raise typer.Exit(1)
+            sql_files[model] = sql_file
+
         # Always apply silver views first so gold model dependencies exist.
         run_silver_views(conn)
-        _pkg = Path(__file__).parent
-        for sql_dir in (_pkg / "sql" / "silver", _pkg / "sql" / "gold"):
-            sql_file = sql_dir / f"{model}.sql"
-            if sql_file.exists():
-                run_sql_file(conn, sql_file)
-                conn.close()
-                typer.echo(f"Materialized: {model}")
-                _log.info("model materialized", model=model)
-                return
+        for model, sql_file in sql_files.items():
+            run_sql_file(conn, sql_file)
+            typer.echo(f"Materialized: {model}")
+            _log().info("model materialized", model=model)
         conn.close()
-        typer.echo(f"Error: model {model!r} not found in silver or gold SQL dirs", err=True)
-        raise typer.Exit(1)
+        return
 
     run_silver_views(conn)
     run_gold_views(conn)
@@ -281,7 +333,7 @@ def materialize(
     typer.echo("Materialize complete")
     typer.echo("  silver views: 7")
     typer.echo("  gold views:   6")
-    _log.info("materialize complete", silver_views=7, gold_views=6)
+    _log().info("materialize complete", silver_views=7, gold_views=6)
 
 
 # ---------------------------------------------------------------------------
@@ -326,27 +378,33 @@ def doctor(
     finally:
         conn.close()
 
-    # Print aligned table of check results.
+    # Print aligned table of check results in a single write.
     _STATUS_LABEL = {"pass": "PASS", "warn": "WARN", "fail": "FAIL"}
     name_width = max(len(r.name) for r in results)
+    lines: list[str] = []
     for r in results:
-        typer.echo(f"  {r.name.ljust(name_width)}  {_STATUS_LABEL[r.status]:4}  {r.message}")
+        lines.append(f"  {r.name.ljust(name_width)}  {_STATUS_LABEL[r.status]:4}  {r.message}")
         if r.hint:
-            typer.echo(f"  {''.ljust(name_width)}        hint: {r.hint}")
+            lines.append(f"  {''.ljust(name_width)}        hint: {r.hint}")
 
     n_warn = sum(1 for r in results if r.status == "warn")
     n_fail = sum(1 for r in results if r.status == "fail")
-    typer.echo()
+    lines.append("")
     if n_fail:
-        typer.echo(f"  {n_warn} warning(s) — {n_fail} failure(s)")
-        _log.warning("doctor finished with failures", warnings=n_warn, failures=n_fail)
+        lines.append(f"  {n_warn} warning(s) — {n_fail} failure(s)")
+    elif n_warn:
+        lines.append(f"  {n_warn} warning(s) — 0 failures")
+    else:
+        lines.append("  all checks passed")
+    typer.echo("\n".join(lines))
+
+    if n_fail:
+        _log().warning("doctor finished with failures", warnings=n_warn, failures=n_fail)
         raise typer.Exit(2)
     if n_warn:
-        typer.echo(f"  {n_warn} warning(s) — 0 failures")
-        _log.warning("doctor finished with warnings", warnings=n_warn)
+        _log().warning("doctor finished with warnings", warnings=n_warn)
         raise typer.Exit(1)
-    typer.echo("  all checks passed")
-    _log.info("doctor finished", status="pass")
+    _log().info("doctor finished", status="pass")
 
 
 # ---------------------------------------------------------------------------
@@ -365,18 +423,21 @@ def config_show() -> None:
     after environment-variable overrides are applied.  Useful for confirming
     that PIPER_* overrides are being picked up correctly.
     """
+    from dataclasses import fields
+
     from piper.config import _config_file, get_settings
 
     settings = get_settings()
 
-    typer.echo(f"\n  config : {_config_file()}\n")
-
-    for section_name, section in settings.model_dump().items():
-        typer.echo(f"  [{section_name}]")
-        width = max(len(k) for k in section)
-        for key, val in section.items():
-            typer.echo(f"  {key.ljust(width)} = {val}")
-        typer.echo()
+    lines = ["", f"  config : {_config_file()}", ""]
+    for section_field in fields(settings):
+        section = getattr(settings, section_field.name)
+        keys = [f.name for f in fields(section)]
+        width = max(len(k) for k in keys)
+        lines.append(f"  [{section_field.name}]")
+        lines.extend(f"  {key.ljust(width)} = {getattr(section, key)}" for key in keys)
+        lines.append("")
+    typer.echo("\n".join(lines))
 
 
 # ---------------------------------------------------------------------------
@@ -405,7 +466,7 @@ def catalog_list(
 
     entries = get_catalog()
     if model:
-        entries = [e for e in entries if e.model == model]
+        entries = tuple(e for e in entries if e.model == model)
 
     if not entries:
         typer.echo("No metrics found." + (f"  (model: {model!r})" if model else ""))
@@ -416,11 +477,9 @@ def catalog_list(
     col_w = max(len(e.column) for e in entries)
 
     header = f"  {'name'.ljust(name_w)}  {'model'.ljust(model_w)}  {'column'.ljust(col_w)}  refresh"
-    typer.echo(header)
-    typer.echo("  " + "-" * (len(header) - 2))
-
-    for e in entries:
-        typer.echo(
-            f"  {e.name.ljust(name_w)}  {e.model.ljust(model_w)}"
-            f"  {e.column.ljust(col_w)}  {e.refresh}"
-        )
+    lines = [header, "  " + "-" * (len(header) - 2)]
+    lines.extend(
+        f"  {e.name.ljust(name_w)}  {e.model.ljust(model_w)}  {e.column.ljust(col_w)}  {e.refresh}"
+        for e in entries
+    )
+    typer.echo("\n".join(lines))
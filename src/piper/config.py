@@ -1,47 +1,104 @@
 """Typed configuration — single source of truth for all piper runtime settings.
 
 Loading priority (highest to lowest):
-  1. Explicit init kwargs (programmatic overrides, tests)
-  2. Environment variables: PIPER_<SECTION>__<KEY>  (double-underscore separator)
-  3. Config file: PIPER_CONFIG_FILE env var, or conf/settings.toml at project root
-  4. Model field defaults
+  1. Environment variables: PIPER_<SECTION>__<KEY>  (double-underscore separator)
+  2. Config file: PIPER_CONFIG_FILE env var, or conf/settings.toml at project root
+     (skipped when the bundled default is absent, e.g. in an installed wheel)
+  3. Dataclass field defaults
+
+Programmatic overrides (tests) construct ``Settings`` directly instead of
+going through ``load_settings()``.
 
 Example env overrides:
   PIPER_PATHS__RAW_ROOT=/custom/raw
   PIPER_INGEST__SETTLE_SECONDS=60
   PIPER_LOGGING__LEVEL=DEBUG
+
+Settings are plain frozen dataclasses parsed with the stdlib ``tomllib``, so
+loading configuration does not import pydantic.  Values from TOML or the
+environment are coerced to each field's declared type in ``__post_init__``.
+Unknown sections are an error; unknown keys inside a known section are
+ignored with a warning, so a stale key in a deployed file does not stop
+the CLI from starting.
+All classes use ``__slots__`` so hot-path reads such as
+``settings.ingest.settle_seconds`` are plain slot fetches.
 """
 
 import os
+import re
+import tomllib
+import warnings
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
-
-from pydantic import BaseModel, field_validator
-from pydantic_settings import (
-    BaseSettings,
-    PydanticBaseSettingsSource,
-    SettingsConfigDict,
-    TomlConfigSettingsSource,
-)
+from typing import Any, Literal, get_args, get_origin, get_type_hints
 
 # Derive project root from this file's location: src/piper/config.py → ../../..
 _PROJECT_ROOT = Path(__file__).parent.parent.parent
 _DEFAULT_CONFIG = _PROJECT_ROOT / "conf" / "settings.toml"
 
+# PIPER_<SECTION>__<KEY> → (section, key).  PIPER_CONFIG_FILE does not match.
+_ENV_KEY = re.compile(r"^PIPER_([A-Z]+)__([A-Z_]+)$")
+
+_TRUE = frozenset({"1", "true", "yes", "on"})
+_FALSE = frozenset({"0", "false", "no", "off"})
+
 
-def _config_file() -> Path:
+def _config_file() -> Path | None:
     """Resolve the config file path.
 
     Returns PIPER_CONFIG_FILE if set (raises FileNotFoundError if missing),
-    otherwise returns the bundled default at conf/settings.toml.
+    otherwise the bundled default at conf/settings.toml, or None when that
+    file does not exist.
     """
     if env_val := os.environ.get("PIPER_CONFIG_FILE"):
         p = Path(env_val)
         if not p.is_file():
             raise FileNotFoundError(f"PIPER_CONFIG_FILE not found: {p}")
         return p
-    return _DEFAULT_CONFIG
+    return _DEFAULT_CONFIG if _DEFAULT_CONFIG.is_file() else None
+
+
+def _coerce(name: str, value: Any, typ: Any) -> Any:
+    """Convert a TOML / env value to the field type *typ*, or raise ValueError."""
+    if get_origin(typ) is Literal:
+        choices = get_args(typ)
+        if value not in choices:
+            raise ValueError(f"{name} must be one of {list(choices)}, got {value!r}")
+        return value
+    if typ is Path:
+        return value if isinstance(value, Path) else Path(value)
+    if typ is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        raise ValueError(f"{name} must be a boolean, got {value!r}")
+    if typ is int:
+        if isinstance(value, bool):
+            raise ValueError(f"{name} must be an integer, got {value!r}")
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be an integer, got {value!r}") from None
+    if typ is str:
+        return str(value)
+    return value
+
+
+class _Section:
+    """Mixin for settings sections: coerce every field to its declared type."""
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        for f in fields(self):  # type: ignore[arg-type]
+            value = _coerce(f.name, getattr(self, f.name), f.type)
+            object.__setattr__(self, f.name, value)
 
 
 # ---------------------------------------------------------------------------
@@ -49,38 +106,45 @@ def _config_file() -> Path:
 # ---------------------------------------------------------------------------
 
 
-class PathsSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PathsSettings(_Section):
     """Filesystem roots for piper's source data and managed output."""
 
     raw_root: Path = Path("/groups/sandwich/05_production/.telemetry/raw")
     data_root: Path = Path("/groups/sandwich/05_production/.telemetry")
 
 
-class IngestSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class IngestSettings(_Section):
     """Controls ingestion behaviour and safety limits."""
 
     # Files modified within this window are skipped to avoid reading mid-write.
     settle_seconds: int = 120
     # Prevents unbounded quarantine growth from a badly misconfigured producer.
     quarantine_max_per_day: int = 1000
+    # Processes used to parse and validate files; 1 keeps work in-process,
+    # 0 means one per CPU.
+    workers: int = 1
 
 
-class LoggingSettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LoggingSettings(_Section):
     """Logging verbosity and output format."""
 
     level: str = "INFO"
     format: Literal["json", "text"] = "json"
 
-    @field_validator("level", mode="before")
-    @classmethod
-    def _normalise_level(cls, v: str) -> str:
+    def __post_init__(self) -> None:
+        # slots=True rebuilds the class, which breaks zero-argument super().
+        _Section.__post_init__(self)
         valid = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v.upper() not in valid:
-            raise ValueError(f"level must be one of {sorted(valid)}, got {v!r}")
-        return v.upper()
+        if self.level.upper() not in valid:
+            raise ValueError(f"level must be one of {sorted(valid)}, got {self.level!r}")
+        object.__setattr__(self, "level", self.level.upper())
 
 
-class PrivacySettings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PrivacySettings(_Section):
     """Privacy controls for dashboard output."""
 
     # Replace host_user with a stable SHA-256 prefix in gold SQL models.
@@ -92,34 +156,65 @@ class PrivacySettings(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """All piper runtime settings, fully resolved and validated."""
 
-    paths: PathsSettings = PathsSettings()
-    ingest: IngestSettings = IngestSettings()
-    logging: LoggingSettings = LoggingSettings()
-    privacy: PrivacySettings = PrivacySettings()
-
-    model_config = SettingsConfigDict(
-        env_prefix="PIPER_",
-        env_nested_delimiter="__",  # PIPER_PATHS__RAW_ROOT → paths.raw_root
-    )
+    paths: PathsSettings = field(default_factory=PathsSettings)
+    ingest: IngestSettings = field(default_factory=IngestSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+    privacy: PrivacySettings = field(default_factory=PrivacySettings)
 
     @classmethod
-    def settings_customise_sources(
-        cls,
-        settings_cls: type[BaseSettings],
-        init_settings: PydanticBaseSettingsSource,
-        env_settings: PydanticBaseSettingsSource,
-        dotenv_settings: PydanticBaseSettingsSource,
-        file_secret_settings: PydanticBaseSettingsSource,
-    ) -> tuple[PydanticBaseSettingsSource, ...]:
-        # Exclude dotenv and file-secret sources; piper uses TOML + env only.
-        return (
-            init_settings,
-            env_settings,
-            TomlConfigSettingsSource(settings_cls, toml_file=_config_file()),
-        )
+    def from_mapping(cls, data: Mapping[str, Mapping[str, Any]]) -> "Settings":
+        """Build settings from a ``{section: {key: value}}`` mapping.
+
+        Unknown keys inside a known section are dropped with a warning.
+
+        Raises:
+            ValueError: An unknown section is present, or a value cannot be
+                        coerced to its field type.
+        """
+        unknown = set(data) - set(_SECTIONS)
+        if unknown:
+            raise ValueError(f"unknown config section(s): {sorted(unknown)}")
+
+        kwargs = {}
+        for name, values in data.items():
+            section_cls = _SECTIONS[name]
+            known = _SECTION_KEYS[name]
+            extra = set(values) - known
+            if extra:
+                warnings.warn(f"ignoring unknown key(s) in [{name}]: {sorted(extra)}", stacklevel=2)
+            kwargs[name] = section_cls(**{k: v for k, v in values.items() if k in known})
+        return cls(**kwargs)
+
+
+# Section name → section class, and the keys each section accepts.
+_SECTIONS: dict[str, Any] = get_type_hints(Settings)
+_SECTION_KEYS = {name: frozenset(f.name for f in fields(cls)) for name, cls in _SECTIONS.items()}
+
+
+def load_settings() -> Settings:
+    """Resolve settings from the config file and ``PIPER_*`` environment.
+
+    Environment variables for sections or keys that do not exist are
+    ignored, so unrelated ``PIPER_`` variables never break startup.
+    """
+    data: dict[str, dict[str, Any]] = {}
+    if (config_file := _config_file()) is not None:
+        with config_file.open("rb") as fh:
+            data = tomllib.load(fh)
+
+    for env_key, value in os.environ.items():
+        match = _ENV_KEY.match(env_key.upper())
+        if match is None:
+            continue
+        section, key = match.group(1).lower(), match.group(2).lower()
+        if key in _SECTION_KEYS.get(section, ()):
+            data.setdefault(section, {})[key] = value
+
+    return Settings.from_mapping(data)
 
 
 @lru_cache(maxsize=1)
@@ -129,4 +224,4 @@ def get_settings() -> Settings:
     Tests should call ``get_settings.cache_clear()`` before each test that
     patches environment variables or the config file.
     """
-    return Settings()
+    return load_settings()
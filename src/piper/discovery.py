@@ -9,11 +9,17 @@ The settle window prevents ingesting files that are still being written
 by the pipeline.  A file modified within the last ``settle_seconds``
 seconds may not yet contain its final events, so it is silently skipped
 and will be picked up on the next run.
+
+The tree is walked with ``os.scandir`` rather than ``Path.rglob``: directory
+entries already know whether they are files or directories, so each
+``*.jsonl`` file costs a single ``stat`` call for its size and mtime.
 """
 
 from __future__ import annotations
 
+import os
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import NamedTuple
 
@@ -54,20 +60,40 @@ def discover_settled_files(
                         value in tests to avoid wall-clock dependence.
 
     Returns:
-        List of :class:`FoundFile`, sorted by ``(mtime, path)`` so the
-        oldest files are processed first.
+        List of :class:`FoundFile`, sorted by ``mtime`` then path string
+        so the oldest files are processed first.
     """
     if not raw_root.is_dir():
         return []
 
     cutoff = (now if now is not None else time.time()) - settle_seconds
 
-    settled = []
-    for path in raw_root.rglob("*.jsonl"):
-        if not path.is_file():
-            continue
-        st = path.stat()
+    # Sort plain (mtime, path_str, size) tuples so ties compare as str rather
+    # than through Path.__lt__, then build FoundFile in final order.
+    settled: list[tuple[float, str, int]] = []
+    for entry in _scan_jsonl(raw_root):
+        st = entry.stat()
         if st.st_mtime <= cutoff:
-            settled.append(FoundFile(path=path, size=st.st_size, mtime=st.st_mtime))
+            settled.append((st.st_mtime, entry.path, st.st_size))
+    settled.sort()
+
+    return [FoundFile(path=Path(path), size=size, mtime=mtime) for mtime, path, size in settled]
+
 
-    return sorted(settled, key=lambda f: (f.mtime, f.path))
+def _scan_jsonl(directory: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Yield ``*.jsonl`` file entries under *directory*, recursively.
+
+    Symlinked directories are not descended into and unreadable or vanished
+    directories are skipped, both matching ``Path.rglob``; symlinks to files
+    are followed.
+    """
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_jsonl(entry.path)
+            elif entry.name.endswith(".jsonl") and entry.is_file():
+                yield entry
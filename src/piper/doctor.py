@@ -4,6 +4,11 @@ Each check is a function that takes an open DuckDB connection and returns a
 ``CheckResult``.  All checks are safe to run on an empty warehouse (they
 return FAIL or WARN with a meaningful message rather than raising).
 
+The checks that read ``silver_events`` share one scan: :func:`silver_stats`
+computes every aggregate they need with conditional ``COUNT(*) FILTER``
+clauses, and :func:`run_checks` passes that :class:`SilverStats` to each of
+them.  Called on their own, those checks compute it themselves.
+
 Exit-code contract (enforced by the CLI):
   0 — all checks passed
   1 — one or more warnings, no failures
@@ -28,21 +33,70 @@ class CheckResult:
     hint: str = ""
 
 
+@dataclass(frozen=True)
+class SilverStats:
+    """Aggregates over ``silver_events`` shared by the silver checks.
+
+    Attributes:
+        n_total:     Rows in ``silver_events``.
+        age_hours:   Hours since the most recent ``occurred_at_utc``
+                     (``None`` when the table is empty).
+        n_recent:    Events that occurred in the last 7 days.
+        n_skew_day:  Events whose ingest/occurrence times differ by > 1 day.
+        n_skew_week: Events whose ingest/occurrence times differ by > 7 days.
+    """
+
+    n_total: int
+    age_hours: float | None
+    n_recent: int
+    n_skew_day: int
+    n_skew_week: int
+
+
+# Age is computed as a plain DOUBLE (hours) entirely in SQL to avoid
+# returning a TIMESTAMPTZ to Python, which requires the optional pytz package.
+_SILVER_STATS_SQL = """
+SELECT
+    COUNT(*),
+    epoch(NOW() - MAX(occurred_at_utc)) / 3600.0,
+    COUNT(*) FILTER (WHERE occurred_at_utc >= NOW() - INTERVAL '7 days'),
+    COUNT(*) FILTER (WHERE ABS(epoch(ingested_at_utc) - epoch(occurred_at_utc)) > 86400),
+    COUNT(*) FILTER (WHERE ABS(epoch(ingested_at_utc) - epoch(occurred_at_utc)) > 7 * 86400)
+FROM silver_events
+"""
+
+
+def silver_stats(conn: duckdb.DuckDBPyConnection) -> SilverStats:
+    """Compute every ``silver_events`` aggregate the checks need in one scan."""
+    row = conn.execute(_SILVER_STATS_SQL).fetchone()
+    assert row is not None  # an aggregate query always returns one row
+    n_total, age_hours, n_recent, n_skew_day, n_skew_week = row
+    return SilverStats(
+        n_total=int(n_total),
+        age_hours=None if age_hours is None else float(age_hours),
+        n_recent=int(n_recent),
+        n_skew_day=int(n_skew_day),
+        n_skew_week=int(n_skew_week),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Individual checks
 # ---------------------------------------------------------------------------
 
 
-def check_freshness(conn: duckdb.DuckDBPyConnection) -> CheckResult:
+def check_freshness(
+    conn: duckdb.DuckDBPyConnection,
+    stats: SilverStats | None = None,
+) -> CheckResult:
     """Most recent event must have arrived within the last 48 hours.
 
     PASS  — most recent event ≤ 48 h ago
     WARN  — 48 h – 96 h ago
     FAIL  — older than 96 h, or no data at all
     """
-    count_row = conn.execute("SELECT COUNT(*) FROM silver_events").fetchone()
-    assert count_row is not None
-    if int(count_row[0]) == 0:
+    stats = stats or silver_stats(conn)
+    if stats.n_total == 0 or stats.age_hours is None:
         return CheckResult(
             name="freshness",
             status="fail",
@@ -50,14 +104,7 @@ def check_freshness(conn: duckdb.DuckDBPyConnection) -> CheckResult:
             hint="run `piper ingest` to pull the latest telemetry",
         )
 
-    # Compute age as a plain DOUBLE (hours) entirely in SQL to avoid returning
-    # a TIMESTAMPTZ to Python, which requires the optional pytz package.
-    age_row = conn.execute(
-        "SELECT epoch(NOW() - MAX(occurred_at_utc)) / 3600.0 FROM silver_events"
-    ).fetchone()
-    assert age_row is not None
-    age_hours = float(age_row[0])
-
+    age_hours = stats.age_hours
     if age_hours <= 48:
         return CheckResult(
             name="freshness",
@@ -79,18 +126,17 @@ def check_freshness(conn: duckdb.DuckDBPyConnection) -> CheckResult:
     )
 
 
-def check_volume(conn: duckdb.DuckDBPyConnection) -> CheckResult:
+def check_volume(
+    conn: duckdb.DuckDBPyConnection,
+    stats: SilverStats | None = None,
+) -> CheckResult:
     """At least 10 events must have been ingested in the last 7 days.
 
     PASS  — ≥ 10 events
     WARN  — 1 – 9 events
     FAIL  — 0 events
     """
-    row = conn.execute(
-        "SELECT COUNT(*) FROM silver_events WHERE occurred_at_utc >= NOW() - INTERVAL '7 days'"
-    ).fetchone()
-    assert row is not None
-    n = int(row[0])
+    n = (stats or silver_stats(conn)).n_recent
 
     if n >= 10:
         return CheckResult(
@@ -160,19 +206,18 @@ def check_invalid_rate(conn: duckdb.DuckDBPyConnection) -> CheckResult:
     )
 
 
-def check_clock_skew(conn: duckdb.DuckDBPyConnection) -> CheckResult:
+def check_clock_skew(
+    conn: duckdb.DuckDBPyConnection,
+    stats: SilverStats | None = None,
+) -> CheckResult:
     """Events whose occurred_at_utc differs from ingested_at_utc by > 7 days.
 
     PASS  — no skewed events
     WARN  — 1 + events with skew 1 – 7 days
     FAIL  — 1 + events with skew > 7 days
     """
-    fail_row = conn.execute(
-        "SELECT COUNT(*) FROM silver_events "
-        "WHERE ABS(epoch(ingested_at_utc) - epoch(occurred_at_utc)) > 7 * 86400"
-    ).fetchone()
-    assert fail_row is not None
-    n_fail = int(fail_row[0])
+    stats = stats or silver_stats(conn)
+    n_fail = stats.n_skew_week
 
     if n_fail > 0:
         return CheckResult(
@@ -182,12 +227,7 @@ def check_clock_skew(conn: duckdb.DuckDBPyConnection) -> CheckResult:
             hint="check host clock synchronisation on field machines",
         )
 
-    warn_row = conn.execute(
-        "SELECT COUNT(*) FROM silver_events "
-        "WHERE ABS(epoch(ingested_at_utc) - epoch(occurred_at_utc)) > 86400"
-    ).fetchone()
-    assert warn_row is not None
-    n_warn = int(warn_row[0])
+    n_warn = stats.n_skew_day
 
     if n_warn > 0:
         return CheckResult(
@@ -215,6 +255,9 @@ _ALL_CHECKS: dict[str, object] = {
     "clock_skew": check_clock_skew,
 }
 
+# Checks that accept the shared SilverStats as their second argument.
+_SILVER_CHECKS = frozenset({"freshness", "volume", "clock_skew"})
+
 
 def run_checks(
     conn: duckdb.DuckDBPyConnection,
@@ -223,6 +266,8 @@ def run_checks(
 ) -> list[CheckResult]:
     """Run all registered checks (or just ``only`` if named) and return results.
 
+    ``silver_events`` is scanned at most once, however many checks run.
+
     Args:
         conn: Open DuckDB connection.
         only: If non-empty, run only the check with this name.
@@ -230,8 +275,17 @@ def run_checks(
     Raises:
         ValueError: If ``only`` names a check that does not exist.
     """
-    if only:
-        if only not in _ALL_CHECKS:
-            raise ValueError(f"unknown check: {only!r}.  Known: {sorted(_ALL_CHECKS)}")
-        return [_ALL_CHECKS[only](conn)]  # type: ignore[operator]
-    return [fn(conn) for fn in _ALL_CHECKS.values()]  # type: ignore[misc]
+    if only and only not in _ALL_CHECKS:
+        raise ValueError(f"unknown check: {only!r}.  Known: {sorted(_ALL_CHECKS)}")
+
+    names = [only] if only else list(_ALL_CHECKS)
+    stats = silver_stats(conn) if _SILVER_CHECKS.intersection(names) else None
+
+    results = []
+    for name in names:
+        fn = _ALL_CHECKS[name]
+        if name in _SILVER_CHECKS:
+            results.append(fn(conn, stats))  # type: ignore[operator]
+        else:
+            results.append(fn(conn))  # type: ignore[operator]
+    return results
@@ -3,34 +3,76 @@
 ``ingest_file(conn, file, quarantine_dir=...)`` is the single entry point.
 It orchestrates the full pipeline for one settled JSONL file:
 
-1. Parse every line with :func:`~piper.parser.parse_jsonl_file`.
+1. Parse every line with :func:`~piper.parser.parse_line`.
 2. Quarantine unparseable lines (bad JSON, non-object values).
 3. Validate parseable lines with :func:`~piper.validate.validate_envelope`.
+   Steps 1 and 3 are fused for well-formed lines via
+   :func:`~piper.validate.validate_envelope_json`.
 4. Quarantine lines whose envelope fails validation.
-5. Normalize accepted envelopes to :class:`~piper.models.row.SilverRow`.
+5. Normalize accepted envelopes to :class:`~piper.models.row.SilverRow`
+   column values, collected straight into an Arrow staging table.
 6. Bulk-upsert into ``silver_events`` with ``ON CONFLICT (event_id) DO NOTHING``
-   so duplicate event IDs are silently skipped.
+   so duplicate event IDs are silently skipped.  Rows are staged as a
+   single Arrow table so DuckDB inserts them in one vectorized statement.
 
 Returns an :class:`IngestStats` summary of the run.
+
+Steps 1–5 are CPU-bound and touch neither DuckDB nor the quarantine
+directory, so they are split out as :func:`prepare_file`.
+:func:`prepare_files` runs that stage across a process pool when more than
+one worker is configured; :func:`load_prepared` then performs the
+quarantine writes and upsert in the process that owns the connection.
+:func:`load_prepared_many` does the same for a stream of files, buffering
+rows across files so that small files share one insert statement.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from datetime import date
+import multiprocessing
+import os
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import UTC, date, datetime
 from pathlib import Path
+from typing import Any
 
 import duckdb
+import pyarrow as pa
 
 from piper.discovery import FoundFile
-from piper.models.row import SilverRow
-from piper.parser import BadLine, parse_jsonl_file
-from piper.quarantine import quarantine_line
-from piper.validate import EnvelopeError, validate_envelope
+from piper.models.row import SilverRow, row_values
+from piper.parser import BadLine, iter_jsonl_lines, parse_line
+from piper.quarantine import quarantine_lines
+from piper.validate import EnvelopeError, validate_envelope, validate_envelope_json
+
+# Staging columns, in SilverRow field order (which is also row_values() order).
+_COLUMNS = tuple(f.name for f in fields(SilverRow))
+
+# Arrow types for the staging table; everything not listed is a string.
+_STAGING_TYPES = {"occurred_at_utc": pa.timestamp("us", tz="UTC"), "source_line": pa.int32()}
+_STAGING_SCHEMA = pa.schema([(name, _STAGING_TYPES.get(name, pa.string())) for name in _COLUMNS])
+
+# Staging-only column holding each row's position in the batch.
+_STAGING_SEQ = "_seq"
+
+# Name under which each batch of rows is registered with DuckDB.
+_STAGING_VIEW = "_piper_silver_staging"
 
-# Column list must match SilverRow.as_params() order exactly.
-_INSERT_SQL = """
+# Rows buffered by load_prepared_many before one INSERT is issued.  Each
+# statement carries a few milliseconds of fixed cost, which dominates when
+# a backfill is made of many small files.
+_BATCH_ROWS = 50_000
+
+# Column list must match SilverRow field order exactly.  Rows are
+# staged as one Arrow table and inserted in a single vectorized statement;
+# QUALIFY keeps the first occurrence of an event_id repeated within the
+# batch, as row-at-a-time ON CONFLICT DO NOTHING would.  RETURNING yields
+# the source file of each newly inserted event, so per-file counts need no
+# table-wide COUNT(*).
+_INSERT_SQL = f"""
 INSERT INTO silver_events (
     event_id, schema_version, event_type, occurred_at_utc, status,
     pipeline_name, pipeline_dcc,
@@ -40,15 +82,41 @@ INSERT INTO silver_events (
     error_code, error_message,
     payload, metrics,
     source_file, source_line
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+)
+SELECT * EXCLUDE ({_STAGING_SEQ}) FROM {_STAGING_VIEW}
+QUALIFY row_number() OVER (PARTITION BY event_id ORDER BY {_STAGING_SEQ}) = 1
 ON CONFLICT (event_id) DO NOTHING
+RETURNING source_file
 """
 
 
-def _silver_count(conn: duckdb.DuckDBPyConnection) -> int:
-    row = conn.execute("SELECT COUNT(*) FROM silver_events").fetchone()
-    assert row is not None  # COUNT(*) always returns exactly one row
-    return int(row[0])
+def _values_to_arrow(values: Sequence[tuple[Any, ...]]) -> pa.Table:
+    """Transpose :func:`~piper.models.row.row_values` tuples into a staging table."""
+    if not values:
+        return _STAGING_SCHEMA.empty_table()
+    columns = zip(*values, strict=True)
+    arrays = [
+        pa.array(column, type=field.type)
+        for column, field in zip(columns, _STAGING_SCHEMA, strict=True)
+    ]
+    return pa.Table.from_arrays(arrays, schema=_STAGING_SCHEMA)
+
+
+def _insert_rows(conn: duckdb.DuckDBPyConnection, rows: pa.Table) -> Counter[str]:
+    """Upsert the staging table *rows* and return new-row counts per ``source_file``.
+
+    A ``_seq`` column recording each row's position is appended first, so
+    the insert keeps the earliest of several rows sharing an ``event_id``.
+    """
+    if not rows.num_rows:
+        return Counter()
+    rows = rows.append_column(_STAGING_SEQ, pa.array(range(rows.num_rows), type=pa.int64()))
+    conn.register(_STAGING_VIEW, rows)
+    try:
+        inserted = conn.execute(_INSERT_SQL).fetchall()
+    finally:
+        conn.unregister(_STAGING_VIEW)
+    return Counter(source_file for (source_file,) in inserted)
 
 
 @dataclass(frozen=True)
@@ -69,6 +137,185 @@ class IngestStats:
     quarantined: int
 
 
+@dataclass(frozen=True)
+class PreparedFile:
+    """Parsed, validated, and normalized contents of one JSONL file.
+
+    Produced by :func:`prepare_file` without touching DuckDB or the
+    filesystem beyond reading the source, so it can be built in a worker
+    process and pickled back to the process that owns the connection.
+
+    Attributes:
+        path:      Source file the contents were read from.
+        total:     Non-blank lines found in the file.
+        rows:      Staging table of normalized rows to upsert, in line order.
+        bad_lines: Unparseable lines followed by envelope validation failures.
+    """
+
+    path: Path
+    total: int
+    rows: pa.Table
+    bad_lines: list[BadLine]
+
+
+def prepare_file(path: Path) -> PreparedFile:
+    """Parse, validate, and normalize *path* without writing anything.
+
+    Args:
+        path: Settled JSONL file to read.
+
+    Returns:
+        :class:`PreparedFile` holding accepted rows and rejected lines.
+    """
+    # Valid lines take the fused parse+validate path.  Anything it rejects is
+    # re-run through parse_line / validate_envelope so that bad JSON and
+    # schema failures keep their distinct quarantine reasons.
+    now = datetime.now(UTC)
+    total = 0
+    values: list[tuple[Any, ...]] = []
+    unparseable: list[BadLine] = []
+    invalid: list[BadLine] = []
+
+    for line_number, raw in iter_jsonl_lines(path):
+        total += 1
+        try:
+            envelope = validate_envelope_json(raw, now=now)
+        except EnvelopeError:
+            parsed = parse_line(line_number, raw)
+            if isinstance(parsed, BadLine):
+                unparseable.append(parsed)
+                continue
+            try:
+                envelope = validate_envelope(parsed.data, now=now)
+            except EnvelopeError as exc:
+                invalid.append(
+                    BadLine(
+                        line_number=line_number,
+                        raw_text=json.dumps(parsed.data, separators=(",", ":")),
+                        reason=str(exc),
+                    )
+                )
+                continue
+        values.append(row_values(envelope, source_file=path, source_line=line_number))
+
+    return PreparedFile(
+        path=path,
+        total=total,
+        rows=_values_to_arrow(values),
+        bad_lines=unparseable + invalid,
+    )
+
+
+def prepare_files(paths: Sequence[Path], *, workers: int = 1) -> Iterator[PreparedFile]:
+    """Yield a :class:`PreparedFile` for each of *paths*, in input order.
+
+    With ``workers > 1`` and more than one path, files are prepared in a
+    ``forkserver`` process pool so parsing and validation use several
+    cores.  Worker processes are started from a clean server process rather
+    than forked from the caller, which may hold DuckDB threads.
+
+    Args:
+        paths:   Files to prepare.
+        workers: Maximum worker processes; ``1`` prepares in-process and
+                 ``0`` uses one worker per CPU.
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(paths) <= 1:
+        yield from map(prepare_file, paths)
+        return
+
+    # Hand each worker several files per task so that a backfill of many
+    # small files is not dominated by per-task IPC; four chunks per worker
+    # still balance uneven file sizes.
+    workers = min(workers, len(paths))
+    chunksize = max(1, len(paths) // (workers * 4))
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        yield from pool.map(prepare_file, paths, chunksize=chunksize)
+
+
+def load_prepared(
+    conn: duckdb.DuckDBPyConnection,
+    prepared: PreparedFile,
+    *,
+    quarantine_dir: Path,
+    today: date | None = None,
+) -> IngestStats:
+    """Quarantine rejected lines and upsert accepted rows for one file.
+
+    Args:
+        conn:           Open DuckDB connection (migrations already applied).
+        prepared:       Output of :func:`prepare_file`.
+        quarantine_dir: Root directory for quarantine output.
+        today:          Override today's date for quarantine partitioning
+                        (pass in tests to avoid wall-clock dependence).
+
+    Returns:
+        :class:`IngestStats` describing what happened.
+    """
+    quarantine_lines(quarantine_dir, prepared.path, prepared.bad_lines, today=today)
+    return _flush(conn, [prepared])[0]
+
+
+def load_prepared_many(
+    conn: duckdb.DuckDBPyConnection,
+    prepared_files: Iterable[PreparedFile],
+    *,
+    quarantine_dir: Path,
+    today: date | None = None,
+    batch_rows: int = _BATCH_ROWS,
+) -> Iterator[IngestStats]:
+    """Like :func:`load_prepared`, but batch the upsert across files.
+
+    Each file's rejected lines are quarantined as it arrives.  Accepted rows
+    are buffered until at least *batch_rows* are pending (or the input is
+    exhausted) and then inserted with a single statement.  Stats are
+    yielded in input order once the batch holding each file is written, and
+    duplicate ``event_id`` values across files keep the earliest file's row,
+    exactly as calling :func:`load_prepared` once per file would.
+
+    Args:
+        conn:           Open DuckDB connection (migrations already applied).
+        prepared_files: Outputs of :func:`prepare_file`, in load order.
+        quarantine_dir: Root directory for quarantine output.
+        today:          Override today's date for quarantine partitioning.
+        batch_rows:     Minimum buffered rows that trigger an insert.
+
+    Yields:
+        One :class:`IngestStats` per input file.
+    """
+    batch: list[PreparedFile] = []
+    buffered = 0
+    for prepared in prepared_files:
+        quarantine_lines(quarantine_dir, prepared.path, prepared.bad_lines, today=today)
+        batch.append(prepared)
+        buffered += prepared.rows.num_rows
+        if buffered >= batch_rows:
+            yield from _flush(conn, batch)
+            batch = []
+            buffered = 0
+    if batch:
+        yield from _flush(conn, batch)
+
+
+def _flush(conn: duckdb.DuckDBPyConnection, batch: Sequence[PreparedFile]) -> list[IngestStats]:
+    """Insert the rows of every file in *batch* and return per-file stats."""
+    inserted = _insert_rows(conn, pa.concat_tables(prepared.rows for prepared in batch))
+    stats = []
+    for prepared in batch:
+        accepted = inserted[str(prepared.path)]
+        stats.append(
+            IngestStats(
+                total=prepared.total,
+                accepted=accepted,
+                duplicate=prepared.rows.num_rows - accepted,
+                quarantined=len(prepared.bad_lines),
+            )
+        )
+    return stats
+
+
 def ingest_file(
     conn: duckdb.DuckDBPyConnection,
     file: FoundFile,
@@ -78,6 +325,8 @@ def ingest_file(
 ) -> IngestStats:
     """Parse, validate, normalize, and upsert one JSONL file.
 
+    Equivalent to :func:`prepare_file` followed by :func:`load_prepared`.
+
     Args:
         conn:          Open DuckDB connection (migrations already applied).
         file:          Settled :class:`~piper.discovery.FoundFile` to ingest.
@@ -88,52 +337,4 @@ def ingest_file(
     Returns:
         :class:`IngestStats` describing what happened.
     """
-    good_lines, bad_lines = parse_jsonl_file(file.path)
-
-    # Step 1 — quarantine unparseable lines
-    for bad in bad_lines:
-        quarantine_line(quarantine_dir, file.path, bad, today=today)
-
-    # Step 2 — validate and normalize parseable lines
-    rows: list[SilverRow] = []
-    validation_errors = 0
-
-    for parsed in good_lines:
-        try:
-            envelope = validate_envelope(parsed.data)
-        except EnvelopeError as exc:
-            quarantine_line(
-                quarantine_dir,
-                file.path,
-                BadLine(
-                    line_number=parsed.line_number,
-                    raw_text=json.dumps(parsed.data, separators=(",", ":")),
-                    reason=str(exc),
-                ),
-                today=today,
-            )
-            validation_errors += 1
-            continue
-        rows.append(
-            SilverRow.from_envelope(
-                envelope,
-                source_file=file.path,
-                source_line=parsed.line_number,
-            )
-        )
-
-    # Step 3 — bulk upsert; count actually-inserted rows via pre/post diff
-    if rows:
-        pre = _silver_count(conn)
-        conn.executemany(_INSERT_SQL, [r.as_params() for r in rows])
-        post = _silver_count(conn)
-        accepted = post - pre
-    else:
-        accepted = 0
-
-    return IngestStats(
-        total=len(good_lines) + len(bad_lines),
-        accepted=accepted,
-        duplicate=len(rows) - accepted,
-        quarantined=len(bad_lines) + validation_errors,
-    )
+    return load_prepared(conn, prepare_file(file.path), quarantine_dir=quarantine_dir, today=today)
@@ -1,12 +1,12 @@
 """Run lock: prevents concurrent piper ingest/backfill runs.
 
-``RunLock(state_dir)`` is a context manager that acquires a PID-file lock
-on entry and releases it on exit.  ``LockError`` is raised if another
-piper process is already running.
+``RunLock(state_dir)`` is a context manager that acquires an exclusive
+``flock`` on the lock file on entry and releases it on exit.  ``LockError``
+is raised if another piper process is already running.
 
-Stale locks (from a process that crashed without releasing) are detected
-by checking whether the recorded PID is still alive; if not, the lock
-file is silently overwritten.
+The kernel drops a ``flock`` when its holder exits for any reason,
+including SIGKILL, so a crashed run can never leave a stale lock behind.
+The holder's PID is written into the file purely for diagnostics.
 
 Usage::
 
@@ -25,6 +25,7 @@ Note: ``state_dir`` must already exist (created by ``piper init`` via
 
 from __future__ import annotations
 
+import fcntl
 import os
 from pathlib import Path
 
@@ -36,7 +37,7 @@ class LockError(RuntimeError):
 
 
 class RunLock:
-    """PID-file lock that prevents concurrent piper runs.
+    """``flock``-based lock that prevents concurrent piper runs.
 
     Args:
         state_dir: The piper state directory (``paths.state_dir``).
@@ -45,37 +46,47 @@ class RunLock:
     def __init__(self, state_dir: Path) -> None:
         self._lock_path = state_dir / LOCK_FILE
         self._pid = os.getpid()
+        self._fd: int | None = None
 
     def acquire(self) -> None:
-        """Write the PID lock file; raise ``LockError`` if already locked.
+        """Take an exclusive, non-blocking ``flock``; raise ``LockError`` if held.
 
-        Uses ``O_CREAT | O_EXCL`` for an atomic create-if-not-exists.
-        If the file already exists, checks whether the owning PID is still
-        alive.  A stale lock (dead process) is silently overwritten.
+        Any existing lock file that nobody holds a lock on (for example one
+        left behind by a killed process) is simply reused.
         """
-        try:
-            fd = os.open(str(self._lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
-        except FileExistsError:
-            existing_pid = self._read_pid()
-            if existing_pid is not None and _is_alive(existing_pid):
+        while True:
+            fd = os.open(self._lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                holder = self._read_pid()
                 raise LockError(
-                    f"piper is already running (PID {existing_pid}).  Lock file: {self._lock_path}"
+                    f"piper is already running (PID {holder if holder is not None else 'unknown'})."
+                    f"  Lock file: {self._lock_path}"
                 ) from None
-            # Stale lock from a dead process — overwrite with our PID.
-            self._lock_path.write_text(str(self._pid))
-            return
+            # The previous holder unlinks the file on release; if that happened
+            # between our open() and flock(), we locked an orphaned inode.
+            if _is_current_file(fd, self._lock_path):
+                break
+            os.close(fd)
 
-        # Atomic create succeeded — write PID into the open file descriptor.
+        os.ftruncate(fd, 0)
         os.write(fd, str(self._pid).encode())
-        os.close(fd)
+        self._fd = fd
 
     def release(self) -> None:
-        """Remove the lock file if it still belongs to this process."""
+        """Remove the lock file and drop the lock, if this instance holds it."""
+        if self._fd is None:
+            return
         try:
-            if self._read_pid() == self._pid:
-                self._lock_path.unlink()
-        except FileNotFoundError:
-            pass  # already removed; that is fine
+            # Unlink while still locked so no other process can acquire the
+            # file we are about to abandon.
+            self._lock_path.unlink(missing_ok=True)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
 
     def __enter__(self) -> RunLock:
         self.acquire()
@@ -92,12 +103,11 @@ class RunLock:
             return None
 
 
-def _is_alive(pid: int) -> bool:
-    """Return True if a process with *pid* is currently running."""
+def _is_current_file(fd: int, path: Path) -> bool:
+    """Return True if *fd* still refers to the file at *path*."""
     try:
-        os.kill(pid, 0)
-        return True
-    except ProcessLookupError:
-        return False  # no such process — stale lock
-    except PermissionError:
-        return True  # process exists but we cannot signal it
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    fst = os.fstat(fd)
+    return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
@@ -7,7 +7,7 @@ Processor pipeline (applied in order to every log event):
 
   1. merge_contextvars   — pulls run_id (and any other bound vars) into the event
   2. add_log_level       — adds  level="info" / "error" / …
-  3. TimeStamper         — adds  timestamp="2026-03-01T02:41:55Z"
+  3. _IsoTimestamper     — adds  timestamp="2026-03-01T02:41:55.123456Z"
   4. JSONRenderer        — renders as a single JSON line  (format=json)
      ConsoleRenderer     — renders as coloured key=value  (format=text)
 
@@ -24,17 +24,58 @@ Typical usage:
 
 import logging as _stdlib
 import sys
+import time
 import uuid
 
 import structlog
+from structlog.typing import EventDict
 
 from piper.config import Settings, get_settings
 
 
+class _StderrProxy:
+    """Minimal text stream that forwards to the *current* ``sys.stderr``."""
+
+    def write(self, text: str) -> int:
+        return sys.stderr.write(text)
+
+    def flush(self) -> None:
+        sys.stderr.flush()
+
+
+_STDERR = _StderrProxy()
+
+
+class _IsoTimestamper:
+    """structlog processor adding ``timestamp="2026-03-01T02:41:55.123456Z"``.
+
+    Equivalent to ``TimeStamper(fmt="iso", utc=True)`` but only formats the
+    date and time once per wall-clock second; events within the same second
+    just append their microseconds to the cached prefix.
+    """
+
+    __slots__ = ("_prefix", "_second")
+
+    def __init__(self) -> None:
+        self._second = -1
+        self._prefix = ""
+
+    def __call__(self, _logger: object, _method: str, event_dict: EventDict) -> EventDict:
+        second, nanos = divmod(time.time_ns(), 1_000_000_000)
+        if second != self._second:
+            self._prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = second
+        event_dict["timestamp"] = f"{self._prefix}.{nanos // 1000:06d}Z"
+        return event_dict
+
+
 def configure_logging(settings: Settings | None = None) -> str:
     """Configure structlog for this process and return the run_id.
 
     Calling again reconfigures the pipeline and binds a fresh run_id.
+    Loggers are cached on first use, so a logger that has already emitted
+    keeps the configuration it was first used with; fetch a new one with
+    :func:`get_logger` after reconfiguring.
 
     Args:
         settings: Pre-loaded settings; loads from ``get_settings()`` if None.
@@ -50,7 +91,7 @@ def configure_logging(settings: Settings | None = None) -> str:
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        _IsoTimestamper(),
     ]
 
     renderer = (
@@ -63,12 +104,12 @@ def configure_logging(settings: Settings | None = None) -> str:
         processors=[*shared_processors, renderer],
         wrapper_class=structlog.make_filtering_bound_logger(level_int),
         context_class=dict,
-        # Logs go to stderr; stdout is reserved for command output.
-        # cache_logger_on_first_use is intentionally False: caching captures a
-        # reference to sys.stderr at first-use time, which breaks CLI test
-        # runners that redirect stderr per-invocation.
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
-        cache_logger_on_first_use=False,
+        # Logs go to stderr; stdout is reserved for command output.  Each
+        # event is a single write() through _STDERR, which looks up
+        # sys.stderr at emit time, so cached loggers keep following CLI test
+        # runners that redirect stderr per invocation.
+        logger_factory=structlog.WriteLoggerFactory(file=_STDERR),  # type: ignore[arg-type]
+        cache_logger_on_first_use=True,
     )
 
     run_id = uuid.uuid4().hex[:8]
@@ -2,8 +2,11 @@
 
 ``is_already_ingested(conn, file)`` checks whether a FoundFile's exact
 fingerprint (path + mtime + size) is recorded in ``ingest_manifest``.
+``filter_pending(conn, files)`` does the same check for a whole discovery
+result against an in-memory index loaded with one query.
 ``mark_ingested(conn, file, *, event_count, error_count)`` upserts the
-file record after successful ingestion so that the next run skips it.
+file record after successful ingestion so that the next run skips it;
+``mark_ingested_many(conn, records)`` does the same for a batch of files.
 
 The fingerprint includes both mtime and size so that a corrected file
 (same path, different content) is detected and re-ingested automatically.
@@ -11,10 +14,24 @@ The fingerprint includes both mtime and size so that a corrected file
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+
 import duckdb
 
 from piper.discovery import FoundFile
 
+_UPSERT_SQL = """
+INSERT INTO ingest_manifest
+    (file_path, file_mtime, file_size, event_count, error_count)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (file_path) DO UPDATE SET
+    file_mtime      = excluded.file_mtime,
+    file_size       = excluded.file_size,
+    ingested_at_utc = now(),
+    event_count     = excluded.event_count,
+    error_count     = excluded.error_count
+"""
+
 
 def is_already_ingested(conn: duckdb.DuckDBPyConnection, file: FoundFile) -> bool:
     """Return True if *file*'s exact fingerprint is already in the manifest.
@@ -32,6 +49,33 @@ def is_already_ingested(conn: duckdb.DuckDBPyConnection, file: FoundFile) -> boo
     return row is not None
 
 
+def load_manifest_index(conn: duckdb.DuckDBPyConnection) -> dict[str, tuple[float, int]]:
+    """Return every manifest fingerprint as ``{file_path: (mtime, size)}``.
+
+    One ``fetchall`` over ``ingest_manifest``; the table holds one small row
+    per source file, so the whole index comfortably fits in memory.
+    """
+    rows = conn.execute("SELECT file_path, file_mtime, file_size FROM ingest_manifest").fetchall()
+    return {path: (mtime, size) for path, mtime, size in rows}
+
+
+def filter_pending(
+    conn: duckdb.DuckDBPyConnection,
+    files: Sequence[FoundFile],
+) -> list[FoundFile]:
+    """Return the members of *files* not yet in the manifest, in input order.
+
+    Equivalent to ``[f for f in files if not is_already_ingested(conn, f)]``
+    but issues a single query: the manifest is preloaded with
+    :func:`load_manifest_index` and each fingerprint is checked in memory.
+    """
+    if not files:
+        return []
+
+    index = load_manifest_index(conn)
+    return [f for f in files if index.get(str(f.path)) != (f.mtime, f.size)]
+
+
 def mark_ingested(
     conn: duckdb.DuckDBPyConnection,
     file: FoundFile,
@@ -44,17 +88,23 @@ def mark_ingested(
     If the same path was previously recorded with a different fingerprint
     (file was corrected and re-ingested), the row is updated in place.
     """
-    conn.execute(
-        """
-        INSERT INTO ingest_manifest
-            (file_path, file_mtime, file_size, event_count, error_count)
-        VALUES (?, ?, ?, ?, ?)
-        ON CONFLICT (file_path) DO UPDATE SET
-            file_mtime      = excluded.file_mtime,
-            file_size       = excluded.file_size,
-            ingested_at_utc = now(),
-            event_count     = excluded.event_count,
-            error_count     = excluded.error_count
-        """,
-        [str(file.path), file.mtime, file.size, event_count, error_count],
-    )
+    conn.execute(_UPSERT_SQL, [str(file.path), file.mtime, file.size, event_count, error_count])
+
+
+def mark_ingested_many(
+    conn: duckdb.DuckDBPyConnection,
+    records: Iterable[tuple[FoundFile, int, int]],
+) -> None:
+    """Record several files as ingested with one prepared upsert.
+
+    Args:
+        conn:    Open DuckDB connection.
+        records: ``(file, event_count, error_count)`` per ingested file.
+                 Same semantics as calling :func:`mark_ingested` for each.
+    """
+    params = [
+        [str(file.path), file.mtime, file.size, event_count, error_count]
+        for file, event_count, error_count in records
+    ]
+    if params:
+        conn.executemany(_UPSERT_SQL, params)
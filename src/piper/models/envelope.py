@@ -57,9 +57,13 @@ class ScopeInfo(BaseModel):
 
     Not every event carries scope — background collectors (storage_scan,
     tractor_poll) typically have no scope at all.
+
+    Frozen so that the empty default on :class:`Envelope` is hashable:
+    pydantic then shares that one instance instead of deep-copying it for
+    every event that carries no scope.
     """
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     show: str | None = None
     sequence: str | None = None
@@ -7,27 +7,34 @@ has been validated and normalized.
 
 ``SilverRow.from_envelope(envelope, source_file=..., source_line=...)`` is
 the single constructor.  ``as_params()`` returns the column values in INSERT
-order, ready to pass directly to DuckDB's ``executemany``.
+order.  Both are built on :func:`row_values`, which :mod:`piper.ingest`
+calls directly: it transposes the value tuples into a columnar staging
+table without allocating a :class:`SilverRow` per line.
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import to_json
+
 from piper.models.envelope import Envelope
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SilverRow:
     """One flattened row destined for ``silver_events``.
 
     Fields follow the schema defined in ``sql/schema/001_init.sql``.
     ``ingested_at_utc`` is omitted here and filled by the DB DEFAULT.
     ``payload`` and ``metrics`` are stored as JSON strings.
+
+    One instance is built per accepted line, so the class uses
+    ``__slots__``: no per-row ``__dict__`` and faster attribute reads in
+    :meth:`as_params`.
     """
 
     # Identity
@@ -89,39 +96,14 @@ class SilverRow:
             source_file: Path of the originating JSONL file.
             source_line: 1-based line number within *source_file*.
         """
-        return cls(
-            event_id=envelope.event_id,
-            schema_version=envelope.schema_version,
-            event_type=envelope.event_type,
-            occurred_at_utc=envelope.occurred_at_utc,
-            status=envelope.status,
-            pipeline_name=envelope.pipeline.name,
-            pipeline_dcc=envelope.pipeline.dcc,
-            host_hostname=envelope.host.hostname,
-            host_user=envelope.host.user,
-            host_os=envelope.host.os,
-            session_id=envelope.session.session_id,
-            action_id=envelope.session.action_id,
-            scope_show=envelope.scope.show,
-            scope_sequence=envelope.scope.sequence,
-            scope_shot=envelope.scope.shot,
-            scope_asset=envelope.scope.asset,
-            scope_department=envelope.scope.department,
-            scope_task=envelope.scope.task,
-            error_code=envelope.error.code if envelope.error else None,
-            error_message=envelope.error.message if envelope.error else None,
-            payload=_to_json(envelope.payload),
-            metrics=_to_json(envelope.metrics),
-            source_file=str(source_file),
-            source_line=source_line,
-        )
+        return cls(*row_values(envelope, source_file=source_file, source_line=source_line))
 
     # ------------------------------------------------------------------
     # Serialization
     # ------------------------------------------------------------------
 
     def as_params(self) -> list[Any]:
-        """Return column values in INSERT order for use with ``executemany``.
+        """Return column values in INSERT order (one staging-table row).
 
         Order matches the ``INSERT INTO silver_events (...)`` statement in
         :mod:`piper.ingest`.
@@ -154,6 +136,57 @@ class SilverRow:
         ]
 
 
-def _to_json(obj: Any) -> str:
-    """Serialize *obj* to a compact JSON string."""
-    return json.dumps(obj, separators=(",", ":"))
+def _to_json(obj: dict[str, Any]) -> str:
+    """Serialize *obj* to a compact JSON string.
+
+    ``pydantic_core.to_json`` is compact by default, preserves key order and
+    writes non-ASCII characters as UTF-8 rather than ``\\u`` escapes.  Empty
+    dicts, the common case for ``metrics``, skip the serializer entirely.
+    """
+    if not obj:
+        return "{}"
+    return to_json(obj).decode()
+
+
+def row_values(envelope: Envelope, *, source_file: Path, source_line: int) -> tuple[Any, ...]:
+    """Return the :class:`SilverRow` column values for *envelope*, in field order.
+
+    Bulk loaders collect these tuples and transpose them straight into
+    columns, skipping the per-row :class:`SilverRow` object.
+    """
+    error = envelope.error
+    scope = envelope.scope
+    return (
+        # Identity
+        envelope.event_id,
+        envelope.schema_version,
+        envelope.event_type,
+        envelope.occurred_at_utc,
+        envelope.status,
+        # Pipeline
+        envelope.pipeline.name,
+        envelope.pipeline.dcc,
+        # Host
+        envelope.host.hostname,
+        envelope.host.user,
+        envelope.host.os,
+        # Session
+        envelope.session.session_id,
+        envelope.session.action_id,
+        # Scope
+        scope.show,
+        scope.sequence,
+        scope.shot,
+        scope.asset,
+        scope.department,
+        scope.task,
+        # Error detail
+        error.code if error else None,
+        error.message if error else None,
+        # Variable content
+        _to_json(envelope.payload),
+        _to_json(envelope.metrics),
+        # Source lineage
+        str(source_file),
+        source_line,
+    )
@@ -13,7 +13,16 @@ Two public functions:
 
 Both functions always rebuild the target directory from scratch so
 re-export is idempotent: running twice with identical data produces
-identical files.
+identical files.  Each dataset is written to a hidden sibling directory
+and swapped into place with two renames, so readers never see a
+half-written dataset; the directory is absent only for the instant
+between the two renames.  If a run dies in that gap, the next export
+restores the previous tree before rebuilding.
+
+Files are zstd-compressed: the payload and metrics JSON columns shrink
+noticeably more than with DuckDB's default Snappy, and zstd decodes about
+as fast.  Row groups keep DuckDB's default size; daily partitions are far
+smaller than one row group, so a larger setting would change nothing.
 
 Layout example::
 
@@ -33,7 +42,9 @@ Layout example::
 
 from __future__ import annotations
 
+import os
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import duckdb
@@ -68,26 +79,23 @@ def export_silver_events(
         Number of rows exported.  Returns 0 if ``silver_events`` is empty
         (the output directory is still created but contains no Parquet files).
     """
-    row = conn.execute("SELECT COUNT(*) FROM silver_events").fetchone()
-    assert row is not None  # COUNT(*) always returns one row
-    n_rows = int(row[0])
-
-    out_dir = silver_dir / "silver_events"
-    if out_dir.exists():
-        shutil.rmtree(out_dir)
-    out_dir.mkdir(parents=True)
 
-    if n_rows > 0:
-        conn.execute(f"""
+    # The leading sort keys match PARTITION_BY; the trailing event_id keeps
+    # row order within each partition file stable across re-exports.
+    def write(out_dir: Path) -> int:
+        return _copy(
+            conn,
+            f"""
             COPY (
                 SELECT *, occurred_at_utc::DATE AS event_date
                 FROM silver_events
                 ORDER BY event_date, event_type, event_id
             ) TO '{out_dir}'
-            (FORMAT PARQUET, PARTITION_BY (event_date, event_type))
-        """)
+            (FORMAT PARQUET, COMPRESSION ZSTD, PARTITION_BY (event_date, event_type))
+            """,
+        )
 
-    return n_rows
+    return _replace_dataset(silver_dir / "silver_events", write)
 
 
 def export_silver_domain(
@@ -120,20 +128,55 @@ def _export_view(
     silver_dir: Path,
 ) -> int:
     """Export one view to Parquet under silver_dir, partitioned by event_date."""
-    row = conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()
-    assert row is not None
-    n_rows = int(row[0])
 
-    out_dir = silver_dir / view
-    if out_dir.exists():
-        shutil.rmtree(out_dir)
-    out_dir.mkdir(parents=True)
-
-    if n_rows > 0:
-        conn.execute(f"""
-            COPY (SELECT * FROM {view} ORDER BY event_date)
+    # PARTITION_BY already groups rows by event_date, so no ORDER BY is needed.
+    def write(out_dir: Path) -> int:
+        return _copy(
+            conn,
+            f"""
+            COPY (SELECT * FROM {view})
             TO '{out_dir}'
-            (FORMAT PARQUET, PARTITION_BY (event_date))
-        """)
+            (FORMAT PARQUET, COMPRESSION ZSTD, PARTITION_BY (event_date))
+            """,
+        )
+
+    return _replace_dataset(silver_dir / view, write)
+
+
+def _copy(conn: duckdb.DuckDBPyConnection, sql: str) -> int:
+    """Run a ``COPY ... TO`` statement and return the number of rows written.
 
+    Empty input writes no files, so no separate ``COUNT(*)`` probe is needed.
+    """
+    row = conn.execute(sql).fetchone()
+    assert row is not None  # COPY always reports a row count
+    return int(row[0])
+
+
+def _replace_dataset(out_dir: Path, write: Callable[[Path], int]) -> int:
+    """Rebuild *out_dir* by writing a fresh copy beside it and swapping it in.
+
+    *write* fills the new directory and returns its row count, which is
+    passed through.  The new and previous trees live in dot-prefixed
+    siblings so dataset globs skip them.  A run interrupted between the two
+    renames leaves only ``.old``; it is moved back into place before any
+    other leftovers are removed.  The previous tree is deleted only after
+    the new one is live.
+    """
+    new_dir = out_dir.with_name(f".{out_dir.name}.new")
+    old_dir = out_dir.with_name(f".{out_dir.name}.old")
+    if old_dir.exists() and not out_dir.exists():
+        os.replace(old_dir, out_dir)
+    for stale in (new_dir, old_dir):
+        if stale.exists():
+            shutil.rmtree(stale)
+
+    new_dir.mkdir(parents=True)
+    n_rows = write(new_dir)
+
+    if out_dir.exists():
+        os.replace(out_dir, old_dir)
+    os.replace(new_dir, out_dir)
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
     return n_rows
@@ -9,15 +9,28 @@
 Empty and whitespace-only lines are skipped silently and do not appear in
 either list.  The caller is responsible for deciding what to do with
 ``bad`` lines — typically passing them to :mod:`piper.quarantine`.
+
+:func:`iter_jsonl_lines` and :func:`parse_line` expose the two halves of
+that loop for callers that validate lines in a fused pass.
+
+Lines are decoded with ``pydantic_core.from_json``: the Rust parser that
+pydantic already ships is several times faster than ``json.loads`` on
+telemetry-sized objects and caches repeated keys such as ``schema_version``
+and ``event_type`` across lines.
 """
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json
+
+# Large reads amortise syscalls; lines are still yielded one at a time.
+_READ_BUFFER = 1024 * 1024
+
 
 @dataclass(frozen=True)
 class ParsedLine:
@@ -51,33 +64,56 @@ def parse_jsonl_file(path: Path) -> tuple[list[ParsedLine], list[BadLine]]:
     good: list[ParsedLine] = []
     bad: list[BadLine] = []
 
-    for line_number, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        raw = raw.strip()
-        if not raw:
-            continue
-
-        try:
-            parsed = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            bad.append(
-                BadLine(
-                    line_number=line_number,
-                    raw_text=raw,
-                    reason=f"invalid JSON: {exc.msg} (col {exc.colno})",
-                )
-            )
-            continue
-
-        if not isinstance(parsed, dict):
-            bad.append(
-                BadLine(
-                    line_number=line_number,
-                    raw_text=raw,
-                    reason=f"expected JSON object, got {type(parsed).__name__}",
-                )
-            )
-            continue
-
-        good.append(ParsedLine(line_number=line_number, data=parsed))
+    for line_number, raw in iter_jsonl_lines(path):
+        result = parse_line(line_number, raw)
+        if isinstance(result, BadLine):
+            bad.append(result)
+        else:
+            good.append(result)
 
     return good, bad
+
+
+def iter_jsonl_lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(line_number, stripped_bytes)`` for each non-blank line of *path*.
+
+    The file is streamed through a buffered binary reader, so only one line
+    is resident at a time and multi-GB files never load whole.  Lines stay as
+    UTF-8 bytes: the JSON parser validates encoding inline and nothing is
+    decoded to ``str`` on the happy path.  Line numbers are 1-based and count
+    blank lines, so they always match the physical line.  Lines end at
+    ``\\n``; a trailing ``\\r`` is stripped with the other whitespace.
+    """
+    with path.open("rb", buffering=_READ_BUFFER) as fh:
+        for line_number, raw in enumerate(fh, start=1):
+            raw = raw.strip()
+            if raw:
+                yield line_number, raw
+
+
+def parse_line(line_number: int, raw: bytes) -> ParsedLine | BadLine:
+    """Parse one stripped, non-blank line into a JSON object.
+
+    Returns:
+        :class:`ParsedLine` for a JSON object, otherwise a :class:`BadLine`
+        whose reason names the JSON error or the unexpected value type.
+        Invalid UTF-8 is reported as invalid JSON, with undecodable bytes
+        replaced in ``raw_text``.
+    """
+    try:
+        parsed = from_json(raw)
+    except ValueError as exc:
+        return BadLine(
+            line_number=line_number,
+            raw_text=raw.decode("utf-8", errors="replace"),
+            reason=f"invalid JSON: {exc}",
+        )
+
+    if not isinstance(parsed, dict):
+        return BadLine(
+            line_number=line_number,
+            raw_text=raw.decode("utf-8", errors="replace"),
+            reason=f"expected JSON object, got {type(parsed).__name__}",
+        )
+
+    return ParsedLine(line_number=line_number, data=parsed)
@@ -16,6 +16,9 @@ from pathlib import Path
 
 from piper.config import Settings
 
+# data_root values whose output directories this process has already created.
+_DIRS_READY: set[Path] = set()
+
 
 @dataclass(frozen=True)
 class ProjectPaths:
@@ -56,8 +59,11 @@ class ProjectPaths:
         """Create all piper-managed output directories (idempotent).
 
         Called by ``piper init``.  Does not touch raw_root — that directory
-        is owned by the pipeline, not piper.
+        is owned by the pipeline, not piper.  Repeat calls for the same
+        data_root within one process return without touching the filesystem.
         """
+        if self.data_root in _DIRS_READY:
+            return
         for path in (
             self.warehouse_dir,
             self.silver_dir,
@@ -66,3 +72,4 @@ class ProjectPaths:
             self.run_logs_dir,
         ):
             path.mkdir(parents=True, exist_ok=True)
+        _DIRS_READY.add(self.data_root)
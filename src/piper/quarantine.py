@@ -14,11 +14,17 @@ Each record captures enough context to investigate the problem later:
 
 Bad lines are *appended*, so quarantine files are themselves valid JSONL
 and can be replayed or audited later without data loss.
+
+``quarantine_lines(quarantine_dir, source_file, bads)`` writes every bad
+line of one source file with a single ``mkdir``, ``open`` and ``write``;
+ingest uses it so a file full of bad lines costs one append, not one per
+line.
 """
 
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from datetime import UTC, date, datetime
 from pathlib import Path
 
@@ -43,16 +49,49 @@ def quarantine_line(
         today:          Override the partition date (for testing).  Defaults
                         to :func:`datetime.date.today`.
     """
+    quarantine_lines(quarantine_dir, source_file, [bad], today=today)
+
+
+def quarantine_lines(
+    quarantine_dir: Path,
+    source_file: Path,
+    bads: Sequence[BadLine],
+    *,
+    today: date | None = None,
+) -> None:
+    """Append every line in *bads* to the quarantine JSONL for *source_file*.
+
+    All records share one ``quarantined_at_utc`` timestamp and are written
+    in a single append.  Does nothing when *bads* is empty.
+
+    Args:
+        quarantine_dir: Root quarantine directory (``paths.quarantine_dir``).
+        source_file:    The JSONL file the bad lines came from.
+        bads:           The :class:`~piper.parser.BadLine` records to write.
+        today:          Override the partition date (for testing).  Defaults
+                        to :func:`datetime.date.today`.
+    """
+    if not bads:
+        return
+
     partition = today if today is not None else date.today()
     day_dir = quarantine_dir / _SUBDIR / partition.strftime("%Y-%m-%d")
     day_dir.mkdir(parents=True, exist_ok=True)
 
-    record = {
-        "quarantined_at_utc": datetime.now(UTC).isoformat(timespec="seconds"),
-        "source_file": str(source_file),
-        "line_number": bad.line_number,
-        "reason": bad.reason,
-        "raw_text": bad.raw_text,
-    }
+    quarantined_at = datetime.now(UTC).isoformat(timespec="seconds")
+    source = str(source_file)
+    records = [
+        json.dumps(
+            {
+                "quarantined_at_utc": quarantined_at,
+                "source_file": source,
+                "line_number": bad.line_number,
+                "reason": bad.reason,
+                "raw_text": bad.raw_text,
+            }
+        )
+        + "\n"
+        for bad in bads
+    ]
     with (day_dir / source_file.name).open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(record) + "\n")
+        fh.write("".join(records))
@@ -87,11 +87,7 @@ def _applied_versions(conn: duckdb.DuckDBPyConnection) -> set[str]:
 def _execute_sql_file(conn: duckdb.DuckDBPyConnection, sql: str) -> None:
     """Execute a SQL file containing one or more semicolon-terminated statements.
 
-    Line comments (``--``) are stripped first so that semicolons inside
-    comments do not create spurious empty statements.
+    The whole file goes to DuckDB in one call.  Its parser splits the
+    statements, so semicolons inside string literals and comments are safe.
     """
-    stripped = "\n".join(ln for ln in sql.splitlines() if not ln.strip().startswith("--"))
-    for stmt in stripped.split(";"):
-        stmt = stmt.strip()
-        if stmt:
-            conn.execute(stmt)
+    conn.execute(sql)
@@ -2,6 +2,7 @@
 
 ``validate_envelope(raw)`` is the single entry point.  It converts a raw dict
 (parsed from one JSONL line) into a typed ``Envelope`` or raises a typed error.
+``validate_envelope_json(line)`` does the same straight from the JSON text.
 
 Error hierarchy (all inherit from ValueError for easy catch-all handling):
 
@@ -123,6 +124,29 @@ def validate_envelope(
     return envelope
 
 
+def validate_envelope_json(
+    raw: str | bytes,
+    *,
+    now: datetime | None = None,
+) -> Envelope:
+    """Parse and validate one raw JSONL line into a typed ``Envelope``.
+
+    Same contract as :func:`validate_envelope`, but JSON decoding and model
+    validation run in a single pydantic-core pass with no intermediate dict.
+    Malformed JSON and non-object values raise :class:`InvalidFieldError`;
+    callers that need to tell those apart from schema failures should fall
+    back to parsing the line first.
+    """
+    try:
+        envelope = Envelope.model_validate_json(raw)
+    except _PydanticError as exc:
+        raise _convert_pydantic_error(exc) from exc
+
+    _check_clock_skew(envelope.occurred_at_utc, now=now)
+
+    return envelope
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
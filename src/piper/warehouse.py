@@ -11,10 +11,15 @@ Typical usage in ``piper init``:
     conn = open_warehouse(paths)
     n = run_migrations(conn)
     conn.close()
+
+``run_migrations`` takes a fast path when the schema is already at head:
+one ``SELECT`` against ``schema_migrations`` is compared with the migration
+files bundled with the package, which are listed once at import.
 """
 
 from __future__ import annotations
 
+import weakref
 from pathlib import Path
 
 import duckdb
@@ -29,6 +34,12 @@ _SQL_DIR = Path(__file__).parent / "sql" / "schema"
 _SQL_SILVER_DIR = Path(__file__).parent / "sql" / "silver"
 _SQL_GOLD_DIR = Path(__file__).parent / "sql" / "gold"
 
+# Version keys of the bundled migrations (file stems), resolved once at import.
+_MIGRATION_VERSIONS = frozenset(p.stem for p in _SQL_DIR.glob("*.sql"))
+
+# Connections already confirmed at head in this process.
+_CURRENT_CONNS: weakref.WeakSet[duckdb.DuckDBPyConnection] = weakref.WeakSet()
+
 
 def open_warehouse(paths: ProjectPaths) -> duckdb.DuckDBPyConnection:
     """Open (or create) the warehouse database and return a connection.
@@ -45,10 +56,27 @@ def run_migrations(conn: duckdb.DuckDBPyConnection) -> int:
     """Apply any pending schema migrations and return the count applied.
 
     Safe to call on every startup: already-applied migrations are skipped.
+    When the database already records every bundled migration, this returns
+    0 without reading the migration directory.
     """
+    if conn in _CURRENT_CONNS or _schema_is_current(conn):
+        _CURRENT_CONNS.add(conn)
+        return 0
+
     from piper.sql_runner import apply_pending_migrations
 
-    return apply_pending_migrations(conn, _SQL_DIR)
+    n = apply_pending_migrations(conn, _SQL_DIR)
+    _CURRENT_CONNS.add(conn)
+    return n
+
+
+def _schema_is_current(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Return True if ``schema_migrations`` lists every bundled migration."""
+    try:
+        rows = conn.execute("SELECT version FROM schema_migrations").fetchall()
+    except duckdb.CatalogException:
+        return False
+    return _MIGRATION_VERSIONS.issubset(row[0] for row in rows)
 
 
 def run_silver_views(conn: duckdb.DuckDBPyConnection) -> None:
@@ -69,3 +97,16 @@ def run_gold_views(conn: duckdb.DuckDBPyConnection) -> None:
     from piper.sql_runner import apply_views
 
     apply_views(conn, _SQL_GOLD_DIR)
+
+
+def model_sql_path(name: str) -> Path | None:
+    """Return the bundled SQL file for the silver or gold model *name*.
+
+    Silver models are checked first.  Returns None if neither layer has a
+    ``<name>.sql`` file.
+    """
+    for sql_dir in (_SQL_SILVER_DIR, _SQL_GOLD_DIR):
+        sql_file = sql_dir / f"{name}.sql"
+        if sql_file.is_file():
+            return sql_file
+    return None
@@ -0,0 +1,72 @@
+"""Session-scoped pipeline fixtures shared by the integration tests.
+
+ingest_env    — copy tests/fixtures/*.jsonl to a temp raw_root and run
+                ``piper ingest`` once; yields ``(env, root)``
+pipeline_env  — the same warehouse after ``piper materialize``; yields
+                ``(env, root)``
+
+Both modules read the same fixture corpus and every command they re-run
+(ingest, materialize, doctor) is idempotent, so one pipeline run serves the
+whole session.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+import structlog
+from typer.testing import CliRunner
+
+from piper.cli import app
+from piper.config import get_settings
+
+_FIXTURE_DIR = Path(__file__).parent.parent / "fixtures"
+
+_runner = CliRunner()
+
+
+@pytest.fixture(scope="session")
+def ingest_env(tmp_path_factory):
+    """Run piper ingest once against all fixture files; yield the env vars."""
+    root = tmp_path_factory.mktemp("pipeline_e2e")
+    raw = root / "raw"
+    raw.mkdir()
+
+    # Copy fixtures with epoch mtime so they are always settled.
+    for src in sorted(_FIXTURE_DIR.glob("*.jsonl")):
+        dst = raw / src.name
+        shutil.copy(src, dst)
+        os.utime(dst, (0.0, 0.0))
+
+    env = {
+        "PIPER_PATHS__RAW_ROOT": str(raw),
+        "PIPER_PATHS__DATA_ROOT": str(root / "data"),
+        "PIPER_INGEST__SETTLE_SECONDS": "0",
+    }
+
+    get_settings.cache_clear()
+    structlog.reset_defaults()
+    result = _runner.invoke(app, ["ingest"], env=env)
+    assert result.exit_code == 0, f"ingest failed:\n{result.output}"
+
+    yield env, root
+
+    get_settings.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def pipeline_env(ingest_env):
+    """Run materialize on the ingested warehouse; yield (env, root)."""
+    env, root = ingest_env
+
+    get_settings.cache_clear()
+    structlog.reset_defaults()
+    result = _runner.invoke(app, ["materialize"], env=env)
+    assert result.exit_code == 0, f"materialize failed:\n{result.output}"
+
+    yield env, root
+
+    get_settings.cache_clear()
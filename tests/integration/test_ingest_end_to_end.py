@@ -5,7 +5,7 @@ the CLI, then query the resulting DuckDB warehouse to verify data integrity.
 They complement the unit tests in tests/test_cli.py (which check exit codes
 and stdout) by asserting that the *right data ended up in the right place*.
 
-Fixture setup (module-scoped, runs once):
+Fixture setup (session-scoped ``ingest_env`` from conftest.py, runs once):
   1. Copy all tests/fixtures/*.jsonl into a temp raw_root with epoch mtimes.
   2. ``piper ingest`` via the CLI runner.
   3. Open the resulting warehouse for read-only queries.
@@ -13,8 +13,6 @@ Fixture setup (module-scoped, runs once):
 
 from __future__ import annotations
 
-import os
-import shutil
 from pathlib import Path
 
 import duckdb
@@ -25,7 +23,6 @@ from typer.testing import CliRunner
 from piper.cli import app
 from piper.config import get_settings
 
-_FIXTURE_DIR = Path(__file__).parent.parent / "fixtures"
 _SCHEMA_DIR = Path(__file__).parent.parent.parent / "src" / "piper" / "sql" / "schema"
 
 _runner = CliRunner()
@@ -54,39 +51,10 @@ _ALL_EVENT_TYPES = {
 
 
 # ---------------------------------------------------------------------------
-# Module-scoped pipeline fixture
+# Warehouse fixture (ingest_env comes from tests/integration/conftest.py)
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(scope="module")
-def ingest_env(tmp_path_factory):
-    """Run piper ingest once against all fixture files; yield the env vars."""
-    root = tmp_path_factory.mktemp("ingest_e2e")
-    raw = root / "raw"
-    raw.mkdir()
-
-    # Copy fixtures with epoch mtime so they are always settled.
-    for src in sorted(_FIXTURE_DIR.glob("*.jsonl")):
-        dst = raw / src.name
-        shutil.copy(src, dst)
-        os.utime(dst, (0.0, 0.0))
-
-    env = {
-        "PIPER_PATHS__RAW_ROOT": str(raw),
-        "PIPER_PATHS__DATA_ROOT": str(root / "data"),
-        "PIPER_INGEST__SETTLE_SECONDS": "0",
-    }
-
-    get_settings.cache_clear()
-    structlog.reset_defaults()
-    result = _runner.invoke(app, ["ingest"], env=env)
-    assert result.exit_code == 0, f"ingest failed:\n{result.output}"
-
-    yield env, root
-
-    get_settings.cache_clear()
-
-
 @pytest.fixture(scope="module")
 def warehouse(ingest_env):
     """Open the warehouse written by the ingest fixture for read-only queries."""
@@ -128,10 +96,10 @@ class TestSilverEventsContent:
         assert row[0] == 0
 
     def test_all_event_ids_are_unique(self, warehouse):
-        total = warehouse.execute("SELECT COUNT(*) FROM silver_events").fetchone()
-        unique = warehouse.execute("SELECT COUNT(DISTINCT event_id) FROM silver_events").fetchone()
-        assert total is not None and unique is not None
-        assert total[0] == unique[0]
+        duplicates = warehouse.execute(
+            "SELECT event_id FROM silver_events GROUP BY event_id HAVING COUNT(*) > 1"
+        ).fetchall()
+        assert duplicates == []
 
 
 # ---------------------------------------------------------------------------
@@ -179,21 +147,22 @@ class TestQuarantine:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def second_ingest(ingest_env):
+    """Re-run piper ingest on the already-ingested raw_root; return the result."""
+    env, _ = ingest_env
+    get_settings.cache_clear()
+    structlog.reset_defaults()
+    return _runner.invoke(app, ["ingest"], env=env)
+
+
 class TestSecondRunIdempotency:
-    def test_second_ingest_skips_all_files(self, ingest_env):
+    def test_second_ingest_skips_all_files(self, second_ingest):
         """Re-running ingest on an already-ingested raw_root processes 0 files."""
-        env, _ = ingest_env
-        get_settings.cache_clear()
-        structlog.reset_defaults()
-        result = _runner.invoke(app, ["ingest"], env=env)
-        assert result.exit_code == 0, result.output
-        assert "0 file(s)" in result.output
-
-    def test_second_ingest_leaves_row_count_unchanged(self, ingest_env, warehouse):
-        env, _ = ingest_env
-        get_settings.cache_clear()
-        structlog.reset_defaults()
-        _runner.invoke(app, ["ingest"], env=env)
+        assert second_ingest.exit_code == 0, second_ingest.output
+        assert "0 file(s)" in second_ingest.output
+
+    def test_second_ingest_leaves_row_count_unchanged(self, second_ingest, warehouse):
         row = warehouse.execute("SELECT COUNT(*) FROM silver_events").fetchone()
         assert row is not None
         assert row[0] == 54
@@ -1,10 +1,19 @@
 """Tests for the metrics catalog loader and piper catalog list command."""
 
+import sys
+import types
+from dataclasses import fields
 from pathlib import Path
 
 from typer.testing import CliRunner
 
-from piper.catalog import get_catalog
+from piper.catalog import (
+    _CATALOG_FILE,
+    CatalogEntry,
+    get_catalog,
+    load_catalog,
+    render_catalog_module,
+)
 from piper.cli import app
 
 _GOLD_MODELS = {
@@ -43,6 +52,69 @@ class TestLoadCatalog:
                 f"Catalog entry {entry.name!r} references unknown model {entry.model!r}"
             )
 
+    def test_get_catalog_is_cached(self):
+        """Repeat calls return the same immutable tuple without re-reading the file."""
+        first = get_catalog()
+        assert isinstance(first, tuple)
+        assert get_catalog() is first
+
+
+# ---------------------------------------------------------------------------
+# render_catalog_module → piper._catalog_data (baked into wheels)
+# ---------------------------------------------------------------------------
+
+
+def _exec_rendered(catalog_file: Path) -> tuple[CatalogEntry, ...]:
+    """Render *catalog_file*, execute the module source, and return CATALOG."""
+    namespace: dict = {}
+    exec(render_catalog_module(catalog_file), namespace)
+    return namespace["CATALOG"]
+
+
+def _assert_same_entries(rendered: tuple, expected: tuple[CatalogEntry, ...]) -> None:
+    """Compare rendered and YAML-loaded entries field by field."""
+    assert isinstance(rendered, tuple)
+    assert len(rendered) == len(expected)
+    for got, want in zip(rendered, expected, strict=True):
+        assert type(got) is CatalogEntry
+        for f in fields(CatalogEntry):
+            assert getattr(got, f.name) == getattr(want, f.name), (want.name, f.name)
+
+
+class TestRenderedCatalog:
+    def test_rendered_module_matches_yaml(self):
+        _assert_same_entries(_exec_rendered(_CATALOG_FILE), load_catalog(_CATALOG_FILE))
+
+    def test_awkward_strings_round_trip(self, tmp_path):
+        """Quotes, backslashes, newlines and non-ASCII survive rendering."""
+        import yaml
+
+        entry = {
+            "name": "it's_a_metric",
+            "owner": 'Team "Q"',
+            "model": "gold_x",
+            "column": "col\\path",
+            "description": "First line — café.\nSecond line with ''' and \"\"\".\n",
+            "refresh": "daily",
+        }
+        catalog = tmp_path / "metrics_catalog.yml"
+        catalog.write_text(yaml.safe_dump({"metrics": [entry]}), encoding="utf-8")
+
+        expected = load_catalog(catalog)
+        assert expected == (CatalogEntry(**entry),)
+        _assert_same_entries(_exec_rendered(catalog), expected)
+
+    def test_get_catalog_prefers_rendered_module(self, monkeypatch):
+        entry = CatalogEntry("m", "team", "gold_x", "col", "desc", "daily")
+        module = types.ModuleType("piper._catalog_data")
+        module.CATALOG = (entry,)  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "piper._catalog_data", module)
+        get_catalog.cache_clear()
+        try:
+            assert get_catalog() == (entry,)
+        finally:
+            get_catalog.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # piper catalog list (CLI)
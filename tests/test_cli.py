@@ -9,25 +9,28 @@ import structlog
 from typer.testing import CliRunner
 
 from piper.cli import app
-from piper.lock import LOCK_FILE
+from piper.lock import RunLock
 
 runner = CliRunner()
 
 _FIXTURE_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture(autouse=True)
-def _reset_structlog():
-    """Isolate each test from structlog state and settings cache."""
+def _reset_state() -> None:
+    """Drop cached settings and any structlog configuration or context."""
     from piper.config import get_settings
 
     get_settings.cache_clear()
     structlog.reset_defaults()
     structlog.contextvars.clear_contextvars()
+
+
+@pytest.fixture(autouse=True)
+def _reset_structlog():
+    """Isolate each test from structlog state and settings cache."""
+    _reset_state()
     yield
-    get_settings.cache_clear()
-    structlog.reset_defaults()
-    structlog.contextvars.clear_contextvars()
+    _reset_state()
 
 
 def _ingest_env(tmp_path: Path, settle_seconds: int = 0) -> dict[str, str]:
@@ -127,18 +130,33 @@ class TestBackfillRequiredOptions:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+def full_ingest(tmp_path_factory):
+    """One full ingest of the fixture data, shared by the tests that read it.
+
+    Returns the env the run used and its CliRunner result.  Class-scoped
+    fixtures run before the autouse per-test reset, so state is reset here
+    on both sides of the invoke.
+    """
+    tmp_path = tmp_path_factory.mktemp("full_ingest")
+    _setup_raw_root(tmp_path)
+    env = _ingest_env(tmp_path)
+    _reset_state()
+    result = runner.invoke(app, ["ingest"], env=env)
+    _reset_state()
+    return env, result
+
+
 class TestIngestCommand:
-    def test_full_run_on_fixture_data_prints_row_counts(self, tmp_path):
+    def test_full_run_on_fixture_data_prints_row_counts(self, full_ingest):
         """Full ingest run on fixture data completes and prints row counts."""
-        _setup_raw_root(tmp_path)
-        result = runner.invoke(app, ["ingest"], env=_ingest_env(tmp_path))
+        _, result = full_ingest
         assert result.exit_code == 0, result.output
         assert "54" in result.output
         assert "rows accepted" in result.output
 
-    def test_full_run_shows_ingest_complete(self, tmp_path):
-        _setup_raw_root(tmp_path)
-        result = runner.invoke(app, ["ingest"], env=_ingest_env(tmp_path))
+    def test_full_run_shows_ingest_complete(self, full_ingest):
+        _, result = full_ingest
         assert "Ingest complete" in result.output
         assert "5 file(s)" in result.output
 
@@ -147,11 +165,9 @@ class TestIngestCommand:
         assert result.exit_code == 0, result.output
         assert "0 file(s)" in result.output
 
-    def test_second_run_skips_already_ingested(self, tmp_path):
+    def test_second_run_skips_already_ingested(self, full_ingest):
         """A file ingested in run 1 is skipped in run 2."""
-        _setup_raw_root(tmp_path)
-        env = _ingest_env(tmp_path)
-        runner.invoke(app, ["ingest"], env=env)
+        env, _ = full_ingest
         result = runner.invoke(app, ["ingest"], env=env)
         assert result.exit_code == 0, result.output
         assert "0 file(s)" in result.output
@@ -160,17 +176,13 @@ class TestIngestCommand:
         """Dry run must leave silver_events empty and print a Dry run banner."""
         import duckdb
 
-        from piper.sql_runner import apply_pending_migrations
-
         _setup_raw_root(tmp_path)
         result = runner.invoke(app, ["ingest", "--dry-run"], env=_ingest_env(tmp_path))
         assert "Dry run" in result.output and "5 file(s)" in result.output
 
+        # ingest migrates the warehouse before planning, so the table exists.
         db = tmp_path / "data" / "warehouse" / "telemetry.duckdb"
-        conn = duckdb.connect(str(db))
-        apply_pending_migrations(
-            conn, Path(__file__).parent.parent / "src" / "piper" / "sql" / "schema"
-        )
+        conn = duckdb.connect(str(db), read_only=True)
         count = conn.execute("SELECT COUNT(*) FROM silver_events").fetchone()
         conn.close()
         assert count is not None and count[0] == 0
@@ -183,7 +195,7 @@ class TestIngestCommand:
         assert "2 file(s)" in result.output
 
     def test_already_running_exits_nonzero(self, tmp_path):
-        """A live lock file causes exit code 1."""
+        """A held run lock causes exit code 1."""
         env = _ingest_env(tmp_path)
         runner.invoke(
             app,
@@ -194,6 +206,32 @@ class TestIngestCommand:
             },
         )
         state_dir = tmp_path / "data" / "state"
-        (state_dir / LOCK_FILE).write_text(str(os.getpid()))
-        result = runner.invoke(app, ["ingest"], env=env)
+        with RunLock(state_dir):
+            result = runner.invoke(app, ["ingest"], env=env)
         assert result.exit_code == 1, result.output
+
+    def test_failure_mid_batch_rolls_back_rows_and_manifest(self, tmp_path, monkeypatch):
+        """A load error leaves neither silver rows nor manifest entries behind."""
+        import duckdb
+
+        import piper.ingest
+
+        real_load = piper.ingest.load_prepared_many
+
+        def flaky_load(conn, prepared_files, **kwargs):
+            loaded = real_load(conn, prepared_files, **kwargs)
+            yield next(loaded)
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(piper.ingest, "load_prepared_many", flaky_load)
+        _setup_raw_root(tmp_path)
+        result = runner.invoke(app, ["ingest"], env=_ingest_env(tmp_path))
+        assert result.exit_code != 0
+
+        db = tmp_path / "data" / "warehouse" / "telemetry.duckdb"
+        conn = duckdb.connect(str(db))
+        silver = conn.execute("SELECT COUNT(*) FROM silver_events").fetchone()
+        manifest = conn.execute("SELECT COUNT(*) FROM ingest_manifest").fetchone()
+        conn.close()
+        assert silver == (0,)
+        assert manifest == (0,)
@@ -1,9 +1,8 @@
 """Tests for the typed configuration system."""
 
 import pytest
-from pydantic import ValidationError
 
-from piper.config import LoggingSettings, Settings, get_settings
+from piper.config import IngestSettings, LoggingSettings, Settings, get_settings, load_settings
 
 
 @pytest.fixture(autouse=True)
@@ -16,37 +15,83 @@ def _clear_settings_cache():
 
 class TestDefaults:
     def test_loads_without_env_overrides(self):
-        s = Settings()
+        s = load_settings()
         assert s.ingest.settle_seconds == 120
         assert s.ingest.quarantine_max_per_day == 1000
         assert s.logging.level == "INFO"
         assert s.logging.format == "json"
         assert s.privacy.mask_users is False
 
+    def test_settings_objects_use_slots(self):
+        """Root and section instances carry no per-instance ``__dict__``."""
+        s = load_settings()
+        for obj in (s, s.paths, s.ingest, s.logging, s.privacy):
+            assert not hasattr(obj, "__dict__")
+
 
 class TestEnvOverrides:
     def test_ingest_settle_seconds(self, monkeypatch):
         monkeypatch.setenv("PIPER_INGEST__SETTLE_SECONDS", "60")
-        assert Settings().ingest.settle_seconds == 60
+        assert load_settings().ingest.settle_seconds == 60
 
     def test_logging_level_uppercase_normalisation(self, monkeypatch):
         monkeypatch.setenv("PIPER_LOGGING__LEVEL", "debug")
-        assert Settings().logging.level == "DEBUG"
+        assert load_settings().logging.level == "DEBUG"
 
     def test_privacy_mask_users(self, monkeypatch):
         monkeypatch.setenv("PIPER_PRIVACY__MASK_USERS", "true")
-        assert Settings().privacy.mask_users is True
+        assert load_settings().privacy.mask_users is True
 
     def test_paths_raw_root(self, monkeypatch, tmp_path):
         monkeypatch.setenv("PIPER_PATHS__RAW_ROOT", str(tmp_path))
-        assert Settings().paths.raw_root == tmp_path
+        assert load_settings().paths.raw_root == tmp_path
+
+    def test_unrelated_piper_env_vars_ignored(self, monkeypatch):
+        monkeypatch.setenv("PIPER_NOSUCH__KEY", "1")
+        monkeypatch.setenv("PIPER_INGEST__NOSUCH_KEY", "1")
+        assert load_settings().ingest.settle_seconds == 120
 
 
 class TestValidation:
     def test_invalid_log_level_raises(self):
-        with pytest.raises(ValidationError, match="level must be one of"):
+        with pytest.raises(ValueError, match="level must be one of"):
             Settings(logging=LoggingSettings(level="NONSENSE"))
 
     def test_invalid_log_format_raises(self):
-        with pytest.raises(ValidationError):
-            Settings.model_validate({"logging": {"format": "xml"}})
+        with pytest.raises(ValueError, match="format must be one of"):
+            Settings.from_mapping({"logging": {"format": "xml"}})
+
+    def test_non_integer_settle_seconds_raises(self):
+        with pytest.raises(ValueError, match="settle_seconds must be an integer"):
+            IngestSettings(settle_seconds="soon")  # type: ignore[arg-type]
+
+    def test_unknown_section_raises(self):
+        with pytest.raises(ValueError, match="unknown config section"):
+            Settings.from_mapping({"nonsense": {}})
+
+    def test_unknown_key_warns_and_is_ignored(self):
+        with pytest.warns(UserWarning, match=r"unknown key\(s\) in \[ingest\]"):
+            s = Settings.from_mapping({"ingest": {"nonsense": 1, "settle_seconds": 5}})
+        assert s.ingest.settle_seconds == 5
+
+
+class TestConfigFile:
+    def test_missing_default_file_falls_back_to_defaults(self, monkeypatch, tmp_path):
+        """An install without conf/settings.toml still loads (env + defaults)."""
+        monkeypatch.delenv("PIPER_CONFIG_FILE", raising=False)
+        monkeypatch.setattr("piper.config._DEFAULT_CONFIG", tmp_path / "settings.toml")
+        monkeypatch.setenv("PIPER_INGEST__SETTLE_SECONDS", "60")
+        s = load_settings()
+        assert s.ingest.settle_seconds == 60
+        assert s.logging.level == "INFO"
+
+    def test_missing_explicit_config_file_raises(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PIPER_CONFIG_FILE", str(tmp_path / "nope.toml"))
+        with pytest.raises(FileNotFoundError, match="PIPER_CONFIG_FILE not found"):
+            load_settings()
+
+    def test_explicit_config_file_is_read(self, monkeypatch, tmp_path):
+        config = tmp_path / "settings.toml"
+        config.write_text("[ingest]\nsettle_seconds = 7\n")
+        monkeypatch.setenv("PIPER_CONFIG_FILE", str(config))
+        assert load_settings().ingest.settle_seconds == 7
@@ -3,6 +3,8 @@
 import os
 from pathlib import Path
 
+import pytest
+
 from piper.discovery import discover_settled_files
 
 _SETTLE = 120  # seconds — matches default settings.ingest.settle_seconds
@@ -70,6 +72,24 @@ class TestDiscoverSettledFiles:
         assert len(result) == 1
         assert result[0].path.suffix == ".jsonl"
 
+    def test_directory_named_like_jsonl_is_descended_not_returned(self, tmp_path):
+        inner = tmp_path / "batch.jsonl" / "events.jsonl"
+        _touch(inner, mtime=_NOW - _SETTLE - 1)
+        result = discover_settled_files(tmp_path, _SETTLE, now=_NOW)
+        assert [f.path for f in result] == [inner]
+
+    @pytest.mark.skipif(os.geteuid() == 0, reason="root ignores directory permissions")
+    def test_unreadable_subdirectory_is_skipped(self, tmp_path):
+        _touch(tmp_path / "ok" / "events.jsonl", mtime=_NOW - _SETTLE - 1)
+        locked = tmp_path / "locked"
+        _touch(locked / "events.jsonl", mtime=_NOW - _SETTLE - 1)
+        locked.chmod(0)
+        try:
+            result = discover_settled_files(tmp_path, _SETTLE, now=_NOW)
+        finally:
+            locked.chmod(0o755)
+        assert [f.path.parent.name for f in result] == ["ok"]
+
     def test_nested_subdirectories_discovered(self, tmp_path):
         for host in ("host1", "host2"):
             for user in ("userA", "userB"):
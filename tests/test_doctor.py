@@ -20,6 +20,7 @@ from piper.doctor import (
     check_invalid_rate,
     check_volume,
     run_checks,
+    silver_stats,
 )
 from piper.sql_runner import apply_pending_migrations
 
@@ -75,6 +76,30 @@ def _insert_manifest_row(
     )
 
 
+# ---------------------------------------------------------------------------
+# silver_stats — shared single-scan aggregates
+# ---------------------------------------------------------------------------
+
+
+class TestSilverStats:
+    def test_empty_db(self, conn):
+        stats = silver_stats(conn)
+        assert stats.n_total == 0
+        assert stats.age_hours is None
+        assert stats.n_recent == stats.n_skew_day == stats.n_skew_week == 0
+
+    def test_counts_match_individual_conditions(self, conn):
+        _insert_event(conn, event_id="recent", hours_ago=1)
+        _insert_event(conn, event_id="two-days", hours_ago=48)
+        _insert_event(conn, event_id="ten-days", hours_ago=240)
+        stats = silver_stats(conn)
+        assert stats.n_total == 3
+        assert stats.age_hours == pytest.approx(1.0, abs=0.1)
+        assert stats.n_recent == 2
+        assert stats.n_skew_day == 2
+        assert stats.n_skew_week == 1
+
+
 # ---------------------------------------------------------------------------
 # check_freshness
 # ---------------------------------------------------------------------------
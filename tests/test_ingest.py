@@ -11,9 +11,15 @@ import duckdb
 import pytest
 
 from piper.discovery import FoundFile
-from piper.ingest import IngestStats, ingest_file
+from piper.ingest import (
+    IngestStats,
+    ingest_file,
+    load_prepared_many,
+    prepare_file,
+    prepare_files,
+)
 from piper.models.envelope import Envelope
-from piper.models.row import SilverRow
+from piper.models.row import SilverRow, row_values
 from piper.sql_runner import apply_pending_migrations
 
 _SQL_DIR = Path(__file__).parent.parent / "src" / "piper" / "sql" / "schema"
@@ -173,6 +179,99 @@ class TestIngestStats:
         assert stats.quarantined == 1
 
 
+# ---------------------------------------------------------------------------
+# prepare_file / prepare_files — the DB-free stage
+# ---------------------------------------------------------------------------
+
+
+class TestPrepareFiles:
+    def test_prepare_file_splits_rows_and_bad_lines(self, tmp_path):
+        bad_event = {k: v for k, v in _make_event().items() if k != "host"}
+        p = tmp_path / "events.jsonl"
+        p.write_text(
+            json.dumps(_make_event()) + "\n{not json}\n" + json.dumps(bad_event) + "\n",
+            encoding="utf-8",
+        )
+
+        prepared = prepare_file(p)
+
+        assert prepared.total == 3
+        assert prepared.rows.column("source_line").to_pylist() == [1]
+        # Unparseable lines first, then validation failures.
+        assert [b.line_number for b in prepared.bad_lines] == [2, 3]
+
+    def test_worker_pool_matches_in_process_order(self, tmp_path):
+        paths = []
+        for i in range(3):
+            file = _write_jsonl(tmp_path / f"f{i}.jsonl", [_make_event() for _ in range(4)])
+            paths.append(file.path)
+
+        serial = list(prepare_files(paths, workers=1))
+        parallel = list(prepare_files(paths, workers=2))
+
+        assert parallel == serial
+
+    def test_zero_workers_means_one_per_cpu(self, tmp_path, monkeypatch):
+        """workers=0 sizes the pool from os.cpu_count(); output is unchanged."""
+        import piper.ingest
+
+        pool_sizes = []
+
+        class SpyPool(piper.ingest.ProcessPoolExecutor):
+            def __init__(self, max_workers=None, **kwargs):
+                pool_sizes.append(max_workers)
+                super().__init__(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(piper.ingest, "ProcessPoolExecutor", SpyPool)
+        monkeypatch.setattr("piper.ingest.os.cpu_count", lambda: 3)
+        paths = [_write_jsonl(tmp_path / f"f{i}.jsonl", [_make_event()]).path for i in range(5)]
+
+        parallel = list(prepare_files(paths, workers=0))
+
+        assert pool_sizes == [3]
+        assert parallel == list(prepare_files(paths, workers=1))
+
+
+class TestLoadPreparedMany:
+    def _prepared(self, tmp_path, groups):
+        return [
+            prepare_file(_write_jsonl(tmp_path / f"f{i}.jsonl", events).path)
+            for i, events in enumerate(groups)
+        ]
+
+    @pytest.mark.parametrize("batch_rows", [1, 1000])
+    def test_cross_file_duplicate_keeps_earliest_file(self, conn, tmp_path, batch_rows):
+        shared = _make_event()
+        prepared = self._prepared(tmp_path, [[shared, _make_event()], [shared], [_make_event()]])
+
+        stats = list(
+            load_prepared_many(
+                conn,
+                prepared,
+                quarantine_dir=tmp_path / "q",
+                today=_TODAY,
+                batch_rows=batch_rows,
+            )
+        )
+
+        assert [(s.accepted, s.duplicate) for s in stats] == [(2, 0), (0, 1), (1, 0)]
+        source = conn.execute(
+            "SELECT source_file FROM silver_events WHERE event_id = ?", [shared["event_id"]]
+        ).fetchone()
+        assert source == (str(prepared[0].path),)
+
+    def test_quarantines_bad_lines_per_file(self, conn, tmp_path):
+        p = tmp_path / "bad.jsonl"
+        p.write_text("{not json}\n", encoding="utf-8")
+
+        stats = list(
+            load_prepared_many(conn, [prepare_file(p)], quarantine_dir=tmp_path / "q", today=_TODAY)
+        )
+
+        assert stats == [IngestStats(total=1, accepted=0, duplicate=0, quarantined=1)]
+        assert (tmp_path / "q" / "invalid_jsonl" / "2026-03-01" / "bad.jsonl").exists()
+
+
 # ---------------------------------------------------------------------------
 # Quarantine output
 # ---------------------------------------------------------------------------
@@ -312,3 +411,20 @@ class TestSilverRow:
         env = self._envelope()
         row = SilverRow.from_envelope(env, source_file=Path("/a.jsonl"), source_line=1)
         assert row.payload == "{}"
+
+    def test_payload_is_compact_and_keeps_non_ascii(self):
+        env = self._envelope(payload={"b": [1, 2], "a": "café"})
+        row = SilverRow.from_envelope(env, source_file=Path("/a.jsonl"), source_line=1)
+        assert row.payload == '{"b":[1,2],"a":"café"}'
+
+    def test_rows_have_no_instance_dict(self):
+        env = self._envelope()
+        row = SilverRow.from_envelope(env, source_file=Path("/a.jsonl"), source_line=1)
+        assert not hasattr(row, "__dict__")
+
+    def test_row_values_match_as_params(self):
+        env = self._envelope(error={"code": "E1", "message": "boom"}, status="error")
+        values = row_values(env, source_file=Path("/a.jsonl"), source_line=3)
+        row = SilverRow.from_envelope(env, source_file=Path("/a.jsonl"), source_line=3)
+        assert list(values) == row.as_params()
+        assert row.error_code == "E1" and row.source_line == 3
@@ -1,4 +1,4 @@
-"""Tests for the PID-file run lock."""
+"""Tests for the flock-based run lock."""
 
 import os
 
@@ -57,6 +57,14 @@ class TestStaleLock:
         assert int((tmp_path / LOCK_FILE).read_text()) == os.getpid()
         lock.release()
 
+    def test_unlocked_file_with_live_pid_is_reused(self, tmp_path):
+        """Only a held flock blocks; a leftover PID alone (e.g. after SIGKILL) does not."""
+        (tmp_path / LOCK_FILE).write_text(str(os.getppid()))
+        lock = RunLock(tmp_path)
+        lock.acquire()
+        assert int((tmp_path / LOCK_FILE).read_text()) == os.getpid()
+        lock.release()
+
     def test_unreadable_lock_content_treated_as_stale(self, tmp_path):
         """A lock file with non-integer content is treated as stale."""
         (tmp_path / LOCK_FILE).write_text("not-a-pid")
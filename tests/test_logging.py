@@ -1,9 +1,14 @@
 """Tests for structured logging configuration."""
 
+import io
+import re
+import sys
+from datetime import UTC, datetime
+
 import structlog
 
 from piper.config import LoggingSettings, Settings
-from piper.logging import configure_logging, get_logger
+from piper.logging import _IsoTimestamper, configure_logging, get_logger
 
 
 def _settings(**kw) -> Settings:
@@ -30,3 +35,26 @@ class TestGetLogger:
         assert events[0]["event"] == "ping"
         ctx = structlog.contextvars.get_contextvars()
         assert ctx["run_id"] == run_id
+
+    def test_cached_logger_follows_redirected_stderr(self, capsys, monkeypatch):
+        """Loggers are cached on first use but still write to the current sys.stderr."""
+        configure_logging(_settings(format="json"))
+        log = get_logger(__name__)
+        log.info("first")
+        assert '"event": "first"' in capsys.readouterr().err
+
+        redirected = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", redirected)
+        log.info("second")
+        assert '"event": "second"' in redirected.getvalue()
+
+
+class TestTimestamp:
+    def test_matches_structlog_iso_utc_format(self):
+        """Same shape as TimeStamper(fmt="iso", utc=True), always with microseconds."""
+        before = datetime.now(UTC)
+        ts = _IsoTimestamper()(None, "info", {})["timestamp"]
+        after = datetime.now(UTC)
+
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z", ts)
+        assert before <= datetime.fromisoformat(ts) <= after
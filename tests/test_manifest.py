@@ -6,7 +6,13 @@ import duckdb
 import pytest
 
 from piper.discovery import FoundFile
-from piper.manifest import is_already_ingested, mark_ingested
+from piper.manifest import (
+    filter_pending,
+    is_already_ingested,
+    load_manifest_index,
+    mark_ingested,
+    mark_ingested_many,
+)
 from piper.sql_runner import apply_pending_migrations
 
 _SQL_DIR = Path(__file__).parent.parent / "src" / "piper" / "sql" / "schema"
@@ -62,6 +68,34 @@ class TestIsAlreadyIngested:
         assert not is_already_ingested(conn, other)
 
 
+# ---------------------------------------------------------------------------
+# load_manifest_index / filter_pending
+# ---------------------------------------------------------------------------
+
+
+class TestFilterPending:
+    def test_manifest_index_maps_path_to_fingerprint(self, conn):
+        assert load_manifest_index(conn) == {}
+        mark_ingested(conn, _FILE, event_count=5, error_count=0)
+        assert load_manifest_index(conn) == {str(_FILE.path): (_FILE.mtime, _FILE.size)}
+
+    def test_empty_input_returns_empty(self, conn):
+        assert filter_pending(conn, []) == []
+
+    def test_untracked_files_all_pending(self, conn):
+        assert filter_pending(conn, [_FILE]) == [_FILE]
+
+    def test_matches_per_file_check(self, conn):
+        """Only exact fingerprints are filtered; input order is preserved."""
+        changed = _FILE._replace(size=_FILE.size + 1)
+        other = FoundFile(path=Path("/raw/host2/user2/2026-02-16.jsonl"), size=1, mtime=1.0)
+        mark_ingested(conn, _FILE, event_count=5, error_count=0)
+
+        files = [other, _FILE, changed]
+        expected = [f for f in files if not is_already_ingested(conn, f)]
+        assert filter_pending(conn, files) == expected == [other, changed]
+
+
 # ---------------------------------------------------------------------------
 # mark_ingested
 # ---------------------------------------------------------------------------
@@ -125,3 +159,22 @@ class TestMarkIngested:
         assert is_already_ingested(conn, _FILE)
         assert is_already_ingested(conn, file_b)
         assert conn.execute("SELECT COUNT(*) FROM ingest_manifest").fetchone()[0] == 2
+
+    def test_mark_ingested_many_matches_single_calls(self, conn):
+        file_b = FoundFile(
+            path=Path("/raw/host2/user2/2026-02-16.jsonl"),
+            size=2048,
+            mtime=_FILE.mtime + 3600,
+        )
+        mark_ingested_many(conn, [(_FILE, 5, 0), (file_b, 8, 1)])
+
+        assert is_already_ingested(conn, _FILE)
+        assert is_already_ingested(conn, file_b)
+        rows = conn.execute(
+            "SELECT event_count, error_count FROM ingest_manifest ORDER BY file_path"
+        ).fetchall()
+        assert rows == [(5, 0), (8, 1)]
+
+    def test_mark_ingested_many_empty_is_noop(self, conn):
+        mark_ingested_many(conn, [])
+        assert conn.execute("SELECT COUNT(*) FROM ingest_manifest").fetchone()[0] == 0
@@ -7,7 +7,7 @@ import pytest
 
 from piper.discovery import FoundFile
 from piper.ingest import ingest_file
-from piper.parquet import export_silver_domain, export_silver_events
+from piper.parquet import _replace_dataset, export_silver_domain, export_silver_events
 from piper.sql_runner import apply_pending_migrations, apply_views
 
 _SQL_DIR = Path(__file__).parent.parent / "src" / "piper" / "sql" / "schema"
@@ -316,3 +316,47 @@ class TestIdempotency:
         ).fetchone()
         assert row is not None
         assert row[0] == 2
+
+    def test_reexport_leaves_no_staging_directories(self, conn, tmp_path):
+        _insert(conn, "id-1", "dcc.launch", "2026-02-15")
+        silver_dir = tmp_path / "silver"
+        export_silver_events(conn, silver_dir)
+        export_silver_events(conn, silver_dir)
+        assert sorted(p.name for p in silver_dir.iterdir()) == ["silver_events"]
+
+    def test_leftover_staging_from_interrupted_run_is_discarded(self, conn, tmp_path):
+        _insert(conn, "id-1", "dcc.launch", "2026-02-15")
+        silver_dir = tmp_path / "silver"
+        stale = silver_dir / ".silver_events.new" / "event_date=1999-01-01"
+        stale.mkdir(parents=True)
+        (stale / "data_0.parquet").write_bytes(b"partial")
+
+        export_silver_events(conn, silver_dir)
+
+        assert not (silver_dir / ".silver_events.new").exists()
+        assert not (silver_dir / "silver_events" / "event_date=1999-01-01").exists()
+
+    def test_previous_tree_restored_after_crash_between_renames(self, tmp_path):
+        """Only .old survives a crash mid-swap; the next run must not delete it."""
+        out_dir = tmp_path / "silver" / "silver_events"
+        previous = tmp_path / "silver" / ".silver_events.old" / "event_date=2026-02-15"
+        previous.mkdir(parents=True)
+        (previous / "data_0.parquet").write_bytes(b"previous")
+
+        def write(_out_dir):
+            raise RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError):
+            _replace_dataset(out_dir, write)
+
+        assert (out_dir / "event_date=2026-02-15" / "data_0.parquet").read_bytes() == b"previous"
+        assert not previous.parent.exists()
+
+    def test_files_are_zstd_compressed(self, conn, tmp_path):
+        _insert(conn, "id-1", "dcc.launch", "2026-02-15")
+        export_silver_events(conn, tmp_path / "silver")
+        codecs = conn.execute(
+            "SELECT DISTINCT compression FROM parquet_metadata("
+            f"'{tmp_path}/silver/silver_events/**/*.parquet')"
+        ).fetchall()
+        assert codecs == [("ZSTD",)]
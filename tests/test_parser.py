@@ -45,6 +45,19 @@ class TestParseJsonlFileHappyPath:
         good, _ = parse_jsonl_file(p)
         assert good[0].line_number == 2
 
+    def test_crlf_line_endings(self, tmp_path):
+        p = tmp_path / "crlf.jsonl"
+        p.write_bytes(b'{"x": 1}\r\n\r\n{"x": 2}\r\n')
+        good, bad = parse_jsonl_file(p)
+        assert [(g.line_number, g.data) for g in good] == [(1, {"x": 1}), (3, {"x": 2})]
+        assert bad == []
+
+    def test_final_line_without_newline(self, tmp_path):
+        p = tmp_path / "tail.jsonl"
+        p.write_bytes(b'{"x": 1}\n{"x": 2}')
+        good, _ = parse_jsonl_file(p)
+        assert [g.data for g in good] == [{"x": 1}, {"x": 2}]
+
 
 # ---------------------------------------------------------------------------
 # Bad lines
@@ -90,6 +103,16 @@ class TestParseJsonlFileBadLines:
         _, bad = parse_jsonl_file(p)
         assert len(bad) == 1
 
+    def test_invalid_utf8_line_goes_to_bad_without_failing_file(self, tmp_path):
+        """A single undecodable line is quarantined; its neighbours still parse."""
+        p = tmp_path / "events.jsonl"
+        p.write_bytes(b'{"ok": 1}\n{"bad": "\xff"}\n{"ok": 2}\n')
+        good, bad = parse_jsonl_file(p)
+        assert [g.line_number for g in good] == [1, 3]
+        assert bad[0].line_number == 2
+        assert "invalid JSON" in bad[0].reason
+        assert "\ufffd" in bad[0].raw_text
+
 
 # ---------------------------------------------------------------------------
 # Integration: real fixture files
@@ -59,3 +59,13 @@ class TestEnsureOutputDirs:
         p = ProjectPaths.from_settings(s)
         p.ensure_output_dirs()
         p.ensure_output_dirs()  # second call must not raise
+
+    def test_repeat_call_in_same_process_skips_filesystem(self, tmp_path):
+        """Once a data_root is prepared, later calls do not re-issue mkdir."""
+        s = _settings_with_data_root(tmp_path)
+        p = ProjectPaths.from_settings(s)
+        p.ensure_output_dirs()
+        p.run_logs_dir.rmdir()
+        p.ensure_output_dirs()
+
+        assert not p.run_logs_dir.exists()
@@ -5,7 +5,7 @@ from datetime import date
 from pathlib import Path
 
 from piper.parser import BadLine
-from piper.quarantine import quarantine_line
+from piper.quarantine import quarantine_line, quarantine_lines
 
 _TODAY = date(2026, 3, 1)
 _SOURCE = Path("/raw/host1/user1/2026-02-15.jsonl")
@@ -128,3 +128,28 @@ class TestAppendBehaviour:
         assert len(lines) == 5
         for line in lines:
             json.loads(line)  # must not raise
+
+
+# ---------------------------------------------------------------------------
+# Batched writes
+# ---------------------------------------------------------------------------
+
+
+class TestQuarantineLines:
+    def test_writes_all_records_in_order(self, tmp_path):
+        bads = [BadLine(line_number=i, raw_text=f"bad{i}", reason="test") for i in (3, 1, 2)]
+        quarantine_lines(tmp_path, _SOURCE, bads, today=_TODAY)
+        out = tmp_path / "invalid_jsonl" / "2026-03-01" / _SOURCE.name
+        records = [json.loads(ln) for ln in out.read_text().splitlines()]
+        assert [r["line_number"] for r in records] == [3, 1, 2]
+        assert len({r["quarantined_at_utc"] for r in records}) == 1
+
+    def test_appends_after_existing_records(self, tmp_path):
+        quarantine_line(tmp_path, _SOURCE, _BAD, today=_TODAY)
+        quarantine_lines(tmp_path, _SOURCE, [_BAD, _BAD], today=_TODAY)
+        out = tmp_path / "invalid_jsonl" / "2026-03-01" / _SOURCE.name
+        assert len(out.read_text().splitlines()) == 3
+
+    def test_empty_batch_creates_nothing(self, tmp_path):
+        quarantine_lines(tmp_path, _SOURCE, [], today=_TODAY)
+        assert not (tmp_path / "invalid_jsonl").exists()
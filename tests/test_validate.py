@@ -10,15 +10,18 @@ Covers:
   - Sub-model optional fields
 """
 
+import json
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from pydantic import ValidationError
 
 from piper.validate import (
     ClockSkewError,
     InvalidFieldError,
     MissingFieldError,
     validate_envelope,
+    validate_envelope_json,
 )
 
 # ---------------------------------------------------------------------------
@@ -69,6 +72,14 @@ class TestHappyPath:
         env = validate_envelope(_base(), now=_NOW)
         assert env.scope.shot is None
 
+    def test_missing_scope_shares_one_frozen_default(self):
+        """Scope-less events reuse the same immutable ScopeInfo instead of copying it."""
+        a = validate_envelope(_base(), now=_NOW)
+        b = validate_envelope(_base(), now=_NOW)
+        assert a.scope is b.scope
+        with pytest.raises(ValidationError):
+            a.scope.shot = "0010"
+
     def test_scope_fields_parsed(self):
         raw = {**_base(), "scope": {"show": "skwondo", "shot": "0010_0020"}}
         env = validate_envelope(raw, now=_NOW)
@@ -261,3 +272,33 @@ class TestClockSkew:
         # Use a timestamp well in the past so wall-clock skew never triggers.
         raw = {**_base(), "occurred_at_utc": "2020-01-01T00:00:00Z"}
         validate_envelope(raw)  # no now= argument
+
+
+# ---------------------------------------------------------------------------
+# validate_envelope_json — fused parse + validate
+# ---------------------------------------------------------------------------
+
+
+class TestValidateEnvelopeJson:
+    def test_matches_dict_validation(self):
+        raw = {**_base(), "payload": {"preset": "web"}, "scope": {"shot": "custom"}}
+        assert validate_envelope_json(json.dumps(raw), now=_NOW) == validate_envelope(raw, now=_NOW)
+
+    def test_accepts_bytes(self):
+        env = validate_envelope_json(json.dumps(_base()).encode(), now=_NOW)
+        assert env.event_type == "playblast.create"
+
+    def test_missing_field_raises_typed_error(self):
+        raw = _base()
+        del raw["event_id"]
+        with pytest.raises(MissingFieldError):
+            validate_envelope_json(json.dumps(raw), now=_NOW)
+
+    def test_malformed_json_raises_invalid_field(self):
+        with pytest.raises(InvalidFieldError):
+            validate_envelope_json("{not json", now=_NOW)
+
+    def test_clock_skew_checked(self):
+        raw = {**_base(), "occurred_at_utc": (_NOW + timedelta(hours=2)).isoformat()}
+        with pytest.raises(ClockSkewError):
+            validate_envelope_json(json.dumps(raw), now=_NOW)
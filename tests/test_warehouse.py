@@ -13,7 +13,7 @@ import pytest
 from piper.config import PathsSettings, Settings
 from piper.paths import ProjectPaths
 from piper.sql_runner import apply_pending_migrations
-from piper.warehouse import WAREHOUSE_FILE, open_warehouse, run_migrations
+from piper.warehouse import WAREHOUSE_FILE, model_sql_path, open_warehouse, run_migrations
 
 # SQL directory bundled with the package.
 _SQL_DIR = Path(__file__).parent.parent / "src" / "piper" / "sql" / "schema"
@@ -67,6 +67,16 @@ class TestApplyPendingMigrations:
         ).fetchall()
         assert rows == [("ingest_manifest",)]
 
+    def test_semicolons_in_literals_and_comments(self, mem_conn, tmp_path):
+        (tmp_path / "001_notes.sql").write_text(
+            "-- seed; with a comment\n"
+            "CREATE TABLE notes (body TEXT);\n"
+            "INSERT INTO notes VALUES ('a;b');  -- trailing; comment\n",
+            encoding="utf-8",
+        )
+        assert apply_pending_migrations(mem_conn, tmp_path) == 1
+        assert mem_conn.execute("SELECT body FROM notes").fetchall() == [("a;b",)]
+
 
 # ---------------------------------------------------------------------------
 # silver_events column schema
@@ -175,3 +185,40 @@ class TestOpenWarehouse:
         conn.close()
         assert n_first == 1  # 001_init.sql applied
         assert n_second == 0  # nothing new
+
+    def test_run_migrations_at_head_skips_migration_runner(self, tmp_path, monkeypatch):
+        """A reopened, already-current warehouse never reaches apply_pending_migrations."""
+        paths = _paths(tmp_path)
+        conn = open_warehouse(paths)
+        run_migrations(conn)
+        conn.close()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("migration runner should not be called")
+
+        monkeypatch.setattr("piper.sql_runner.apply_pending_migrations", _fail)
+        conn = open_warehouse(paths)
+        try:
+            assert run_migrations(conn) == 0
+        finally:
+            conn.close()
+
+
+# ---------------------------------------------------------------------------
+# model_sql_path
+# ---------------------------------------------------------------------------
+
+
+class TestModelSqlPath:
+    def test_resolves_silver_model(self):
+        path = model_sql_path("silver_publish_usd")
+        assert path is not None
+        assert path.parent.name == "silver"
+
+    def test_resolves_gold_model(self):
+        path = model_sql_path("gold_publish_health_daily")
+        assert path is not None
+        assert path.parent.name == "gold"
+
+    def test_unknown_model_returns_none(self):
+        assert model_sql_path("no_such_model") is None